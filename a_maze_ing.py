@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 from mazegen import MazeGenerator
+from mazegen.cache import MazeCache
 from mazegen.config_parser import Configuration, ConfigParser
 from mazegen.output_writer import OutputWriter
 from mazeview import MazeVisualizerOne
@@ -33,12 +34,22 @@ def main() -> None:
         exit(1)
 
     configuration: Configuration = ConfigParser.parse_config(Path(sys.argv[1]))
+    cache = None
+    if configuration.cache_dir:
+        try:
+            cache = MazeCache(configuration.cache_dir)
+        except OSError:
+            print(f"Cache directory {configuration.cache_dir} not usable, "
+                  "running without cache", file=sys.stderr)
     generator = MazeGenerator(configuration.width,
                               configuration.height,
                               configuration.entry,
                               configuration.exit,
                               configuration.perfect,
-                              configuration.seed)
+                              configuration.seed,
+                              algorithm=configuration.algorithm,
+                              loop_density=configuration.loop_density,
+                              cache=cache)
     data = generator.grid.cells
     path = generator.solution
     output_writer = OutputWriter(configuration)
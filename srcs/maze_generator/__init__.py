@@ -1 +1,2 @@
 from .maze_generator import MazeGenerator  # noqa: F401
+from .batch import MazeResult, generate_many  # noqa: F401
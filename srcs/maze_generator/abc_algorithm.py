@@ -1,6 +1,48 @@
 from abc import ABC, abstractmethod
-from .grid import Grid
-from typing import Tuple, Set
+from .grid import Grid, Wall
+from .rng import new_rng
+from .topology import Topology, CLOSED_WALLS, OPEN_WALLS, OPPOSITE
+from typing import Callable, Iterator, List, Tuple, Set
+from functools import cached_property
+from array import array
+
+# Fraction of the closed interior walls opened in non-perfect mazes
+DEFAULT_LOOP_DENSITY = 0.3
+
+# Number of carve events per batch yielded by `Algorithm.iter_generate()`
+DEFAULT_BATCH_SIZE = 4096
+
+# Byte masks used by `Algorithm.braid()`: every wall bit of a free
+# cell, and the walls of a cell that do not face the grid border
+_FREE_MASK = bytes([0x0F]) + bytes(255)
+_INNER_MASK = bytes(~value & 0x0F for value in range(256))
+
+
+def _draw_table(threshold: int, wall: int) -> bytes:
+    """
+    Return the translate table mapping a random byte to `wall` when
+    it is below `threshold`, 0 otherwise.
+    """
+    return bytes(wall if value < threshold else 0 for value in range(256))
+
+
+def _repeat(value: int, count: int) -> int:
+    """
+    Return `count` bytes equal to `value` as a little-endian integer.
+    """
+    return int.from_bytes(bytes([value]) * count, "little")
+
+
+def decode_event(event: int) -> Tuple[int, Wall]:
+    """
+    Split a carve event into the flat index of a cell and the wall
+    opened from it.
+
+    Carve events are packed as ``index << 4 | wall``; opening every
+    event of `Algorithm.iter_generate()`, in order, on a grid with all
+    walls closed rebuilds the generated maze.
+    """
+    return event >> 4, Wall(event & 0x0F)
 
 
 class Algorithm(ABC):
@@ -9,7 +51,8 @@ class Algorithm(ABC):
 
     This class defines the common interface and shared logic for
     concrete maze generation implementations. Subclasses must
-    implement the `generate()` method.
+    implement the `generate()` method; those carving step by step
+    also override `iter_generate()` and make `generate()` drive it.
 
     Attributes:
         width (int): Width of the maze grid.
@@ -19,14 +62,27 @@ class Algorithm(ABC):
         perfect (bool): Indicates whether the maze must be perfect
             (i.e., without cycles and with a unique solution).
         seed (None | str): Optional seed for deterministic generation.
-        grid (Grid): Internal grid representation of the maze.
+        rng (random.Random): Random stream owned by the instance,
+            restarted from `seed` by `reset_rng()`. Algorithms never
+            use the module-global `random` functions, so several
+            instances can generate concurrently.
+        grid (Grid): Internal grid representation of the maze,
+            created on first access.
+        topology (Topology): Flat cell indexing shared by the
+            generation loops (neighbour offsets, border masks),
+            created on first access.
+        visited (bytearray): Per-cell visited map used while carving.
+        loop_density (float): Fraction of the closed interior walls
+            opened by `braid()` when `perfect` is False.
     """
-    grid: Grid
+    visited: bytearray
 
     def __init__(self, width: int, height: int,
                  entry: Tuple[int, int], exit: Tuple[int, int],
                  perfect: bool,
-                 seed: None | str) -> None:
+                 seed: None | str,
+                 grid_factory: Callable[[int, int], Grid] = Grid,
+                 loop_density: float = DEFAULT_LOOP_DENSITY) -> None:
         """
         Initialize common algorithm parameters and create the grid.
 
@@ -37,6 +93,11 @@ class Algorithm(ABC):
             exit (Tuple[int, int]): Exit cell coordinates.
             perfect (bool): Whether the maze must be perfect.
             seed (None | str): Optional random seed for reproducibility.
+            grid_factory (Callable[[int, int], Grid]): Callable building
+                the grid from (width, height), e.g. ``Grid`` or
+                ``PackedGrid``.
+            loop_density (float): Fraction of the closed interior
+                walls opened in non-perfect mazes, between 0 and 1.
         """
         super().__init__()
         self.width = width
@@ -45,7 +106,33 @@ class Algorithm(ABC):
         self.exit = exit
         self.perfect = perfect
         self.seed = seed
-        self.grid = Grid(width, height)
+        self.grid_factory = grid_factory
+        self.loop_density = loop_density
+        self.rng = new_rng(seed)
+
+    @cached_property
+    def grid(self) -> Grid:
+        """
+        Maze grid, allocated on first access so that streaming
+        algorithms never hold a full grid.
+        """
+        return self.grid_factory(self.width, self.height)
+
+    @cached_property
+    def topology(self) -> Topology:
+        """
+        Flat cell indexing of the grid, built on first access.
+        """
+        return Topology(self.width, self.height)
+
+    def reset_rng(self) -> None:
+        """
+        Restart the random stream from `seed` (if provided), so every
+        `generate()` call of a seeded algorithm builds the same maze.
+        Unseeded algorithms keep drawing from their stream.
+        """
+        if self.seed:
+            self.rng.seed(self.seed)
 
     @abstractmethod
     def generate(self) -> Grid:
@@ -61,6 +148,56 @@ class Algorithm(ABC):
         """
         pass
 
+    def iter_generate(self, batch_size: int = DEFAULT_BATCH_SIZE
+                      ) -> Iterator[array]:
+        """
+        Generate the maze while yielding its carve events.
+
+        Events are packed as ``index << 4 | wall`` (see
+        `decode_event()`) and yielded in ``array('q')`` batches of at
+        most `batch_size` events, so consumers can render
+        progressively, stream the maze or stop early. The grid holds
+        every event of the batches already yielded.
+
+        This default implementation runs `generate()` and replays the
+        passages of the finished grid (east / south walls, row-major
+        order); step-wise algorithms override it.
+
+        Args:
+            batch_size (int): Maximum number of events per batch.
+
+        Yields:
+            array: Carve events.
+        """
+        self.generate()
+        yield from self.iter_passages(batch_size)
+
+    def iter_passages(self, batch_size: int = DEFAULT_BATCH_SIZE
+                      ) -> Iterator[array]:
+        """
+        Yield the open east / south walls of the grid as carve events.
+
+        Args:
+            batch_size (int): Maximum number of events per batch.
+
+        Yields:
+            array: Carve events, in row-major order.
+        """
+        width, border = self.width, self.topology.border
+        batch = array("q")
+        for row in range(self.height):
+            start = row * width
+            for col, value in enumerate(self.grid.get_row(row)):
+                index = start + col
+                for wall in CLOSED_WALLS[~(value | border[index]) &
+                                         (Wall.EAST | Wall.SOUTH)]:
+                    batch.append(index << 4 | wall)
+                    if len(batch) == batch_size:
+                        yield batch
+                        batch = array("q")
+        if batch:
+            yield batch
+
     def get_42_cells(self) -> Set[Tuple[int, int]] | str:
         """
         Compute the set of grid cells used to represent the '42' pattern.
@@ -80,7 +217,7 @@ class Algorithm(ABC):
         if self.width < 7 or self.height < 5:
             return ("'42' number can not be represented. "
                     "Maze size is too small\n")
-        row, col = self.grid.center
+        row, col = self.height // 2, self.width // 2
         cells_42: Set[Tuple[int, int]] = set()
         cells_42.add((row, col - 1))
         cells_42.add((row, col - 2))
@@ -108,3 +245,222 @@ class Algorithm(ABC):
             return ("Exit coordinates are in '42' cells. "
                     "'42' number can not be represented.\n")
         return cells_42
+
+    def reserved_cells(self) -> Set[Tuple[int, int]]:
+        """
+        Return the '42' cells, or an empty set (after printing the
+        reason) when the pattern can not be represented.
+        """
+        cells_42 = self.get_42_cells()
+        if isinstance(cells_42, str):
+            print(cells_42)
+            return set()
+        return cells_42
+
+    def new_visited_map(self, cells_42: Set[Tuple[int, int]]) -> bytearray:
+        """
+        Create a visited map with only the '42' cells marked.
+
+        Args:
+            cells_42 (Set[Tuple[int, int]]): Reserved cells.
+
+        Returns:
+            bytearray: One byte per cell, 1 meaning visited.
+        """
+        visited = bytearray(self.topology.size)
+        for row, col in cells_42:
+            visited[self.topology.index(row, col)] = 1
+        return visited
+
+    def inner_walls(self, blocked: bytearray) -> Tuple[int, int]:
+        """
+        Return the interior east and south walls joining two free
+        cells, as per-cell masks packed in little-endian integers (one
+        byte per cell, like ``grid.get_row()``).
+
+        Args:
+            blocked (bytearray): Per-cell map of reserved cells.
+
+        Returns:
+            Tuple[int, int]: The east wall mask and the south wall mask.
+        """
+        size, width = self.topology.size, self.width
+        free = int.from_bytes(blocked.translate(_FREE_MASK), "little")
+        inner = int.from_bytes(self.topology.border.translate(_INNER_MASK),
+                               "little")
+        east = free & (free >> 8) & inner & _repeat(Wall.EAST, size)
+        south = free & (free >> 8 * width) & inner & _repeat(Wall.SOUTH, size)
+        return east, south
+
+    def braid(self, cells_42: Set[Tuple[int, int]]) -> bytes:
+        """
+        Open random closed walls of the carved maze to create cycles.
+
+        Every interior wall between two free cells is opened with
+        probability `loop_density`. The draws are made in bulk (one
+        `rng.randbytes()` call, one byte per east and south wall),
+        turned into wall bit masks with `bytes.translate()` and
+        combined with the free cell and border masks as big integers,
+        so no Python code runs per cell. The '42' cells are never
+        opened.
+
+        Args:
+            cells_42 (Set[Tuple[int, int]]): Reserved cells.
+
+        Returns:
+            bytes: Per-cell mask of the east / south walls opened.
+        """
+        size, width = self.topology.size, self.width
+        threshold = min(256, round(self.loop_density * 256))
+        if threshold == 0 or size < 2:
+            return bytes(size)
+        draws = self.rng.randbytes(2 * size)
+        opened = int.from_bytes(
+            draws[:size].translate(_draw_table(threshold, Wall.EAST)),
+            "little") | int.from_bytes(
+            draws[size:].translate(_draw_table(threshold, Wall.SOUTH)),
+            "little")
+        east, south = self.inner_walls(self.new_visited_map(cells_42))
+        cells = int.from_bytes(
+            b"".join(self.grid.get_row(row) for row in range(self.height)),
+            "little")
+        opened &= (east | south) & cells
+        mask = opened.to_bytes(size, "little")
+        opened |= (opened & east) << 10 | (opened & south) << 8 * width - 2
+        self.grid.set_rows(0, (cells & ~opened).to_bytes(size, "little"))
+        return mask
+
+    def iter_braid(self, cells_42: Set[Tuple[int, int]],
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[array]:
+        """
+        Run `braid()` and yield the walls it opened as carve events.
+
+        Args:
+            cells_42 (Set[Tuple[int, int]]): Reserved cells.
+            batch_size (int): Maximum number of events per batch.
+
+        Yields:
+            array: Carve events, in flat index order.
+        """
+        batch = array("q")
+        for index, walls in enumerate(self.braid(cells_42)):
+            if walls:
+                for wall in CLOSED_WALLS[walls]:
+                    batch.append(index << 4 | wall)
+                    if len(batch) == batch_size:
+                        yield batch
+                        batch = array("q")
+        if batch:
+            yield batch
+
+    def recarve_region(self, top_left: Tuple[int, int],
+                       bottom_right: Tuple[int, int]) -> List[int]:
+        """
+        Carve the passages of a rectangle of the generated grid again.
+
+        The free cells of the region are grouped into the areas that
+        their current passages connect inside the region. Every area
+        gets a new random spanning tree (DFS backtracker) and the
+        passages crossing the region border are kept, so each area
+        still links the same outside cells: the rest of the maze is
+        untouched and a perfect maze stays perfect. When `perfect` is
+        False, interior walls of the region are then opened with
+        probability `loop_density`.
+
+        Only the region cells are read and written, so the cost is
+        proportional to the region size. Draws continue the instance
+        random stream (`rng`).
+
+        Args:
+            top_left (Tuple[int, int]): (row, col) of the first cell.
+            bottom_right (Tuple[int, int]): (row, col) of the last
+                cell, inclusive.
+
+        Returns:
+            List[int]: Flat indices of the cells whose walls changed.
+
+        Raises:
+            ValueError: If the region is empty or not inside the grid.
+        """
+        top, left = top_left
+        bottom, right = bottom_right
+        if not (0 <= top <= bottom < self.height and
+                0 <= left <= right < self.width):
+            raise ValueError(f"invalid region {top_left} - {bottom_right}")
+        cells_42 = self.get_42_cells()
+        blocked = set() if isinstance(cells_42, str) else cells_42
+        grid, width, rng = self.grid, self.width, self.rng
+        region_width = right - left + 1
+        size = (bottom - top + 1) * region_width
+        offset = (0, -region_width, 1, 0, region_width, 0, 0, 0, -1)
+        indices = [row * width + col for row in range(top, bottom + 1)
+                   for col in range(left, right + 1)]
+        old = bytearray(grid.get_at(index) for index in indices)
+        # Walls of each region cell that face another region cell
+        inner = bytearray(size)
+        for local in range(size):
+            row, col = divmod(local, region_width)
+            inner[local] = ((Wall.NORTH if row else 0) |
+                            (Wall.SOUTH if local + region_width < size
+                             else 0) |
+                            (Wall.WEST if col else 0) |
+                            (Wall.EAST if col + 1 < region_width else 0))
+
+        area = [0] * size
+        for local, index in enumerate(indices):
+            if divmod(index, width) in blocked:
+                area[local] = -1
+        count = 0
+        for start in range(size):
+            if area[start]:
+                continue
+            count += 1
+            area[start] = count
+            stack = [start]
+            while stack:
+                local = stack.pop()
+                for wall in OPEN_WALLS[old[local] | ~inner[local] & 0x0F]:
+                    other = local + offset[wall]
+                    if not area[other]:
+                        area[other] = count
+                        stack.append(other)
+
+        new = bytearray(value | inner[local] if area[local] > 0 else value
+                        for local, value in enumerate(old))
+        visited = bytearray(size)
+        for start in range(size):
+            if area[start] <= 0 or visited[start]:
+                continue
+            visited[start] = 1
+            stack = [start]
+            while stack:
+                local = stack[-1]
+                walls = [wall for wall in CLOSED_WALLS[inner[local]]
+                         if area[local + offset[wall]] == area[local] and
+                         not visited[local + offset[wall]]]
+                if not walls:
+                    stack.pop()
+                    continue
+                wall = rng.choice(walls)
+                other = local + offset[wall]
+                visited[other] = 1
+                new[local] &= ~wall
+                new[other] &= ~OPPOSITE[wall]
+                stack.append(other)
+
+        if not self.perfect:
+            for local in range(size):
+                for wall in CLOSED_WALLS[new[local] & inner[local] &
+                                         (Wall.EAST | Wall.SOUTH)]:
+                    other = local + offset[wall]
+                    if area[local] > 0 and area[other] > 0 and\
+                            rng.random() < self.loop_density:
+                        new[local] &= ~wall
+                        new[other] &= ~OPPOSITE[wall]
+
+        changed = []
+        for local, index in enumerate(indices):
+            if new[local] != old[local]:
+                grid.set_at(index, new[local])
+                changed.append(index)
+        return changed
@@ -0,0 +1,168 @@
+from .config_parser import Configuration
+from .grid import PackedGrid
+from .maze_generator import MazeGenerator
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                wait)
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator, List, Set, Tuple
+import os
+import time
+
+# One maze to build: (index, width, height, entry, exit, perfect, seed,
+# algorithm, loop_density)
+Task = Tuple[int, int, int, Tuple[int, int], Tuple[int, int], bool,
+             None | str, str, float]
+
+
+@dataclass
+class MazeResult:
+    """
+    One maze built by `generate_many()`.
+
+    The grid travels between processes as the packed bytes of a
+    `PackedGrid` (two cells per byte) instead of pickled rows.
+
+    Attributes:
+        index (int): Position of the job in the `generate_many()` input.
+        width (int): Maze width.
+        height (int): Maze height.
+        seed (None | str): Seed the maze was built with.
+        cells (bytes): Packed cell values (``PackedGrid.buffer``).
+        solution (str): Shortest path from entry to exit.
+        seconds (float): Time spent generating and solving the maze.
+    """
+    index: int
+    width: int
+    height: int
+    seed: None | str
+    cells: bytes
+    solution: str
+    seconds: float
+
+    def to_grid(self) -> PackedGrid:
+        """
+        Rebuild the maze grid from the packed cells.
+        """
+        grid = PackedGrid(self.width, self.height)
+        grid.buffer[:] = self.cells
+        return grid
+
+
+def build_chunk(tasks: List[Task]) -> List[MazeResult]:
+    """
+    Worker entry point: build every maze of a chunk.
+
+    Args:
+        tasks (List[Task]): Mazes to build.
+
+    Returns:
+        List[MazeResult]: One result per task, in the same order.
+    """
+    results = []
+    for (index, width, height, entry, exit, perfect, seed, algorithm,
+         loop_density) in tasks:
+        start = time.perf_counter()
+        maze = MazeGenerator(width, height, entry, exit, perfect, seed,
+                             grid_factory=PackedGrid, algorithm=algorithm,
+                             loop_density=loop_density)
+        seconds = time.perf_counter() - start
+        results.append(MazeResult(index, width, height, seed,
+                                  bytes(maze.grid.buffer), maze.solution,
+                                  seconds))
+    return results
+
+
+def make_task(index: int, job: Configuration | None | str,
+              template: Configuration | None) -> Task:
+    """
+    Turn a `generate_many()` job into a task.
+
+    Args:
+        index (int): Position of the job in the input.
+        job (Configuration | None | str): A configuration, or a seed
+            applied to `template`.
+        template (Configuration | None): Parameters used for seed jobs.
+
+    Returns:
+        Task: The maze to build.
+
+    Raises:
+        ValueError: If a seed is given without a template.
+    """
+    if isinstance(job, Configuration):
+        config, seed = job, job.seed
+    elif template is None:
+        raise ValueError("generate_many() needs a template configuration "
+                         "to build mazes from seeds")
+    else:
+        config, seed = template, job
+    return (index, config.width, config.height, config.entry, config.exit,
+            config.perfect, seed, config.algorithm, config.loop_density)
+
+
+def generate_many(jobs: Iterable[Configuration | None | str],
+                  template: Configuration | None = None,
+                  workers: int | None = None,
+                  chunk_size: int = 16,
+                  max_pending: int | None = None) -> Iterator[MazeResult]:
+    """
+    Build many mazes over a process pool.
+
+    Jobs are read lazily and grouped in chunks of `chunk_size` mazes;
+    at most `max_pending` chunks are queued or running at any time,
+    and new jobs are only read when a chunk is done. Memory therefore
+    stays bounded however many jobs are given, and a slow consumer
+    holds the workers back (backpressure).
+
+    Example:
+        for result in generate_many(map(str, range(1_000_000)),
+                                    template=config, workers=8):
+            store(result.index, result.cells, result.solution)
+
+    Args:
+        jobs (Iterable[Configuration | None | str]): Configurations, or
+            seeds (None for a random maze) applied to `template`.
+        template (Configuration | None): Parameters of the seed jobs.
+        workers (int | None): Number of worker processes, None for one
+            per CPU. With 1, mazes are built in this process.
+        chunk_size (int): Number of mazes sent to a worker at once.
+        max_pending (int | None): Maximum number of chunks in flight,
+            twice the number of workers by default.
+
+    Yields:
+        MazeResult: Results in completion order (chunk by chunk); use
+        `MazeResult.index` to restore the input order.
+
+    Raises:
+        ValueError: If `chunk_size` or `max_pending` is not positive,
+            or a seed is given without a template.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * workers
+    if chunk_size < 1 or max_pending < 1:
+        raise ValueError("chunk_size and max_pending must be positive")
+    tasks = (make_task(index, job, template)
+             for index, job in enumerate(jobs))
+    if workers == 1:
+        while chunk := list(islice(tasks, chunk_size)):
+            yield from build_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(workers) as pool:
+        pending: Set[Future[List[MazeResult]]] = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < max_pending:
+                chunk = list(islice(tasks, chunk_size))
+                if not chunk:
+                    exhausted = True
+                else:
+                    pending.add(pool.submit(build_chunk, chunk))
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
@@ -0,0 +1,128 @@
+from .registry import CALIBRATION_FILE, algorithm_names, get_algorithm
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+# Order in which 'auto' tries the algorithms, DFS look first
+PREFERENCE = ["dfs", "kruskal", "eller", "parallel",
+              "sidewinder", "binary_tree"]
+DEFAULT_SIZES = (32, 128, 512)
+# Generation time under which 'auto' keeps the preferred algorithm
+DEFAULT_BUDGET = 0.5
+
+
+def measure(name: str, side: int, perfect: bool, repeat: int = 3) -> float:
+    """
+    Generate a square maze and return the best throughput.
+
+    The generation is repeated up to `repeat` times while the total
+    time stays under a second; the fastest run is kept so warm-up
+    costs (imports, first allocations) do not skew small sizes.
+
+    Args:
+        name (str): Registered algorithm name.
+        side (int): Width and height of the maze.
+        perfect (bool): Whether the maze must be perfect.
+        repeat (int): Maximum number of runs.
+
+    Returns:
+        float: Cells generated per second.
+    """
+    algorithm = get_algorithm(name)(side, side, (0, 0), (side - 1, side - 1),
+                                    perfect, "benchmark")
+    best = float("inf")
+    total = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        algorithm.generate()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        if total > 1.0:
+            break
+    return side * side / max(best, 1e-9)
+
+
+def calibrate(sizes: Sequence[int] = DEFAULT_SIZES,
+              names: Sequence[str] | None = None,
+              budget: float = DEFAULT_BUDGET) -> Dict[str, Any]:
+    """
+    Measure every algorithm at every size, in both perfect modes.
+
+    Args:
+        sizes (Sequence[int]): Square maze sides to measure.
+        names (Sequence[str] | None): Algorithms to measure, all the
+            registered ones by default ('parallel' only with more than
+            one CPU: a single-CPU measure says nothing about it).
+        budget (float): Seconds under which 'auto' keeps the preferred
+            algorithm.
+
+    Returns:
+        Dict[str, Any]: Calibration table for `registry.select_algorithm`.
+    """
+    if names is None:
+        names = [name for name in algorithm_names()
+                 if name != "parallel" or (os.cpu_count() or 1) > 1]
+    results: Dict[str, Dict[str, List[Dict[str, float]]]] = {}
+    for name in names:
+        results[name] = {"perfect": [], "imperfect": []}
+        for perfect in (True, False):
+            for side in sizes:
+                rate = measure(name, side, perfect)
+                results[name]["perfect" if perfect else "imperfect"].append(
+                    {"cells": side * side, "cells_per_second": round(rate)})
+                print(f"{name:12} {side:6}x{side:<6} "
+                      f"{'perfect' if perfect else 'imperfect':9} "
+                      f"{rate:14.0f} cells/s", file=sys.stderr)
+    return {
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "budget_seconds": budget,
+        "preference": PREFERENCE,
+        "results": results,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """
+    Regenerate the calibration table used by ``ALGORITHM=auto``.
+
+    Usage:
+        python -m mazegen.benchmark [--output FILE] [--sizes 32 128 512]
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m mazegen.benchmark",
+        description="Measure the maze generation algorithms and write "
+                    "the calibration table used by ALGORITHM=auto.")
+    parser.add_argument("--output", type=Path, default=CALIBRATION_FILE,
+                        help="calibration file to write "
+                             "(default: the bundled one)")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=list(DEFAULT_SIZES),
+                        help="square maze sides to measure")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help="seconds under which the preferred "
+                             "algorithm is kept")
+    parser.add_argument("--algorithms", nargs="+", choices=algorithm_names(),
+                        help="algorithms to measure (default: all)")
+    args = parser.parse_args(argv)
+    table = calibrate(args.sizes, args.algorithms, args.budget)
+    try:
+        with open(args.output, "w") as f:
+            json.dump(table, f, indent=2)
+            f.write("\n")
+    except OSError:
+        print(f"[ERROR] failed to write calibration file: {args.output}",
+              file=sys.stderr)
+        exit(1)
+    print(f"Calibration written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
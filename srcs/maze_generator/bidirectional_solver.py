@@ -0,0 +1,99 @@
+from .grid import Grid
+from .solver import START, Solver
+from .topology import Topology, OPEN_WALLS, OPPOSITE, DIRECTION_CHARS
+from typing import List, Tuple
+
+
+class BidirectionalSolver(Solver):
+    """
+    Bidirectional Breadth-First Search maze solver.
+
+    Two BFS run from `entry` and from `exit`; a whole level of the
+    smaller frontier is expanded at a time. Every cell records the
+    wall leading back to the side that reached it: towards the entry
+    for the forward search (as in `Solver`), towards the exit for the
+    backward one. The first cell seen by both searches joins two half
+    paths into a shortest path (no meeting before the current level
+    means no shorter path exists), returned in the same 'NESW' format.
+
+    In open, non-perfect mazes each side only explores a disc of half
+    the path length, a fraction of what one-sided BFS visits. The
+    path has the length of `Solver.find_path()`, but may be another
+    shortest path.
+    """
+
+    def find_path(self, grid: Grid, entry: Tuple[int, int],
+                  exit: Tuple[int, int]) -> str:
+        """
+        Compute a shortest path from entry to exit, searching from both
+        ends.
+
+        Args:
+            grid (Grid): The maze grid containing wall information.
+            entry (Tuple[int, int]): Starting cell coordinates.
+            exit (Tuple[int, int]): Target cell coordinates.
+
+        Returns:
+            str: Shortest path as a sequence of directions
+            ('N', 'E', 'S', 'W').
+            Returns an empty string if no path exists.
+        """
+        self.grid = grid
+        self.topology = Topology(grid.width, grid.height)
+        offset = self.topology.offset
+        border = self.topology.border
+        cells = self.read_cells(grid)
+        start = self.topology.index(*entry)
+        end = self.topology.index(*exit)
+        if start == end:
+            return ""
+        # forward[cell]: wall entered through from the entry side;
+        # backward[cell]: wall to take towards the exit
+        forward = bytearray(self.topology.size)
+        backward = bytearray(self.topology.size)
+        forward[start] = START
+        backward[end] = START
+        forward_frontier = [start]
+        backward_frontier = [end]
+        while forward_frontier and backward_frontier:
+            is_forward = len(forward_frontier) <= len(backward_frontier)
+            if is_forward:
+                frontier, seen, other = forward_frontier, forward, backward
+            else:
+                frontier, seen, other = backward_frontier, backward, forward
+            following: List[int] = []
+            for current in frontier:
+                for wall in OPEN_WALLS[cells[current] | border[current]]:
+                    neighbour = current + offset[wall]
+                    if seen[neighbour]:
+                        continue
+                    if other[neighbour]:
+                        if is_forward:
+                            return self.join_paths(forward, backward,
+                                                   current, wall, offset)
+                        return self.join_paths(forward, backward, neighbour,
+                                               OPPOSITE[wall], offset)
+                    seen[neighbour] = wall if is_forward else OPPOSITE[wall]
+                    following.append(neighbour)
+            if is_forward:
+                forward_frontier = following
+            else:
+                backward_frontier = following
+        return ""
+
+    def join_paths(self, forward: bytearray, backward: bytearray,
+                   cell: int, wall: int, offset: Tuple[int, ...]) -> str:
+        """
+        Join the half path reaching `cell` from the entry, the step
+        through `wall`, and the half path from the next cell to the
+        exit.
+        """
+        directions = [self.trace_path(forward, offset, cell),
+                      DIRECTION_CHARS[wall]]
+        current = cell + offset[wall]
+        step = backward[current]
+        while step != START:
+            directions.append(DIRECTION_CHARS[step])
+            current += offset[step]
+            step = backward[current]
+        return "".join(directions)
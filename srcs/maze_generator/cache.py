@@ -0,0 +1,142 @@
+from .grid import pack_cells, unpack_cells
+from pathlib import Path
+from typing import Any, Tuple
+import hashlib
+import os
+import tempfile
+
+# Bumped whenever generation changes, so older entries are never read
+CACHE_VERSION = 1
+
+# Default total size of the cache files before the oldest are evicted
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SUFFIX = ".maze"
+_MAGIC = b"MAZE"
+
+
+class MazeCache:
+    """
+    Content-addressed on-disk cache of generated mazes.
+
+    A seeded maze only depends on its generation parameters, so it is
+    stored under the SHA-256 of those parameters (`key()`). An entry
+    holds the packed cell values (two cells per byte, see
+    `grid.pack_cells()`) and the solution.
+
+    Entries are written to a temporary file in the cache directory and
+    moved in place with `os.replace()`, so several processes can share
+    a directory and readers never see a partial file. Reading an entry
+    refreshes its modification time; once the entries exceed
+    `max_bytes`, the least recently used ones are deleted.
+
+    Attributes:
+        directory (Path): Cache directory, created if needed.
+        max_bytes (int): Total size kept after each store.
+    """
+
+    def __init__(self, directory: Path | str,
+                 max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Open (and create) a cache directory.
+
+        Args:
+            directory (Path | str): Cache directory.
+            max_bytes (int): Total size of the entries kept.
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(*parameters: Any) -> str:
+        """
+        Return the cache key of a set of generation parameters
+        (width, height, entry, exit, perfect, seed, algorithm, ...).
+        """
+        text = repr((CACHE_VERSION, *parameters))
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """
+        Return the file of an entry.
+        """
+        return self.directory / (key + _SUFFIX)
+
+    def load(self, key: str, count: int) -> Tuple[bytes, str] | None:
+        """
+        Read an entry.
+
+        Args:
+            key (str): Entry key.
+            count (int): Number of cells of the maze.
+
+        Returns:
+            Tuple[bytes, str] | None: Cell values (one byte per cell)
+            and solution, or None when the entry is missing or
+            unreadable.
+        """
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        magic, solution, packed = (data.split(b"\n", 2) + [b"", b""])[:3]
+        if magic != _MAGIC or len(packed) != (count + 1) // 2:
+            return None
+        return unpack_cells(packed, count), solution.decode("ascii")
+
+    def store(self, key: str, cells: bytes, solution: str) -> None:
+        """
+        Write an entry atomically, then evict the least recently used
+        entries if the cache is too big. Write errors are ignored: the
+        cache is only an optimization.
+
+        Args:
+            key (str): Entry key.
+            cells (bytes): Cell values, one byte per cell.
+            solution (str): Shortest path from entry to exit.
+        """
+        data = b"\n".join([_MAGIC, solution.encode("ascii"),
+                           pack_cells(cells)])
+        try:
+            fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(temp, self.path(key))
+            except OSError:
+                os.unlink(temp)
+                raise
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Delete the least recently used entries until the cache holds
+        at most `max_bytes`. Entries removed meanwhile by another
+        process are skipped.
+        """
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            total -= size
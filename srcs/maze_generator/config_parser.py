@@ -1,5 +1,7 @@
+from .abc_algorithm import DEFAULT_LOOP_DENSITY
+from .registry import AUTO, algorithm_names
 from pydantic import BaseModel, Field, model_validator, ValidationError
-from typing import Dict, Tuple, Self, List
+from typing import Any, Dict, Tuple, Self, List
 from pathlib import Path
 import sys
 
@@ -22,6 +24,14 @@ class Configuration(BaseModel):
             (i.e., with a unique solution).
         seed (None | str): Optional seed used to make maze generation
             reproducible.
+        algorithm (str): Name of the generation algorithm
+            (see `mazegen.registry`), or 'auto' to pick the fastest
+            one for the maze size. Defaults to 'dfs'.
+        loop_density (float): Fraction of the closed interior walls
+            opened in non-perfect mazes, between 0 and 1.
+            Defaults to 0.3.
+        cache_dir (None | str): Optional directory of the on-disk
+            cache of seeded mazes (see `mazegen.cache.MazeCache`).
     """
 
     width: int = Field(ge=1, le=2147483648)
@@ -31,6 +41,9 @@ class Configuration(BaseModel):
     output_file: str = Field(min_length=5)
     perfect: bool
     seed: None | str = Field(default=None)
+    algorithm: str = Field(default="dfs")
+    loop_density: float = Field(default=DEFAULT_LOOP_DENSITY, ge=0, le=1)
+    cache_dir: None | str = Field(default=None)
 
     @model_validator(mode="before")
     def preprocess_fields(cls, row_data: Dict) -> Dict:
@@ -45,6 +58,7 @@ class Configuration(BaseModel):
             - Enforces strict boolean parsing for the 'perfect' field,
           allowing only "true" or "false" (case-insensitive).
             - Converts the 'perfect' field into a boolean.
+            - Lowercases the 'algorithm' name.
 
         Args:
             row_data (Dict): Raw configuration dictionary parsed
@@ -109,6 +123,11 @@ class Configuration(BaseModel):
             )
 
         row_data["perfect"] = perfect_value.lower() == "true"
+
+        # ---- ALGORITHM ----
+        algorithm_value = row_data.get("algorithm")
+        if isinstance(algorithm_value, str):
+            row_data["algorithm"] = algorithm_value.lower()
         return row_data
 
     @model_validator(mode="after")
@@ -121,6 +140,7 @@ class Configuration(BaseModel):
             - Coordinates are non-negative.
             - Coordinates are inside maze bounds.
             - Output file has a '.txt' extension.
+            - Algorithm is registered (or 'auto').
 
         Returns:
             Self: Validated configuration instance.
@@ -149,6 +169,9 @@ class Configuration(BaseModel):
         if not self.output_file.endswith(".txt"):
             raise ValueError(" - Field 'OUTPUT': "
                              "file name must contain '.txt'")
+        if self.algorithm != AUTO and self.algorithm not in algorithm_names():
+            raise ValueError(" - Field 'ALGORITHM': must be one of "
+                             f"{', '.join([AUTO] + algorithm_names())}")
         return self
 
 
@@ -177,7 +200,8 @@ class ConfigParser():
         Raises:
             SystemExit: If the file is missing or contains invalid data.
         """
-        row_data: Dict[str, str] = {}
+        # Raw strings, coerced to the field types by pydantic
+        row_data: Dict[str, Any] = {}
         data: List[str]
         try:
             with open(file_path, mode="r") as f:
@@ -0,0 +1,90 @@
+from .grid import Grid
+from .solver import START, Solver
+from .topology import Topology, OPEN_WALLS
+from array import array
+from typing import Tuple
+
+
+class DistanceIndex:
+    """
+    Distance field of a maze from its entry.
+
+    One BFS from `entry` records, for every cell, its distance in
+    steps and the wall it was entered through, in flat arrays indexed
+    like the grid. Afterwards `distance()` is a lookup and `path_to()`
+    walks the parent walls back, in time proportional to the path
+    length, with no further search.
+
+    The index describes the grid as it was when built;
+    `MazeGenerator.distance_index` builds one on demand and drops it
+    whenever the maze changes.
+
+    Attributes:
+        entry (Tuple[int, int]): Cell the distances are measured from.
+        topology (Topology): Flat cell indexing of the grid.
+        distances (array): Steps from the entry per cell, -1 when the
+            cell can not be reached.
+        parents (bytearray): Wall each cell was entered through,
+            `START` for the entry and 0 for unreachable cells.
+        order (array): Reachable cells in BFS order (by increasing
+            distance); every cell comes after the one it was entered
+            from.
+    """
+
+    def __init__(self, grid: Grid, entry: Tuple[int, int]) -> None:
+        """
+        Run the BFS from the entry over the whole grid.
+
+        Args:
+            grid (Grid): The maze grid containing wall information.
+            entry (Tuple[int, int]): Starting cell coordinates.
+        """
+        self.entry = entry
+        self.topology = Topology(grid.width, grid.height)
+        offset = self.topology.offset
+        border = self.topology.border
+        cells = Solver.read_cells(grid)
+        size = self.topology.size
+        typecode = "i" if size < 2 ** 31 else "q"
+        self.distances = array(typecode, [-1]) * size
+        self.parents = bytearray(size)
+        start = self.topology.index(*entry)
+        self.parents[start] = START
+        self.distances[start] = 0
+        distances, parents = self.distances, self.parents
+        # The BFS queue is kept whole: it is the visiting order
+        self.order = order = array(typecode, [start])
+        head = 0
+        while head < len(order):
+            current = order[head]
+            head += 1
+            step = distances[current] + 1
+            for wall in OPEN_WALLS[cells[current] | border[current]]:
+                neighbour = current + offset[wall]
+                if not parents[neighbour]:
+                    parents[neighbour] = wall
+                    distances[neighbour] = step
+                    order.append(neighbour)
+
+    def distance(self, cell: Tuple[int, int]) -> int:
+        """
+        Return the number of steps from the entry to a cell, or -1 if
+        it can not be reached.
+        """
+        return self.distances[self.topology.index(*cell)]
+
+    def path_to(self, cell: Tuple[int, int]) -> str:
+        """
+        Return the shortest path from the entry to a cell.
+
+        Args:
+            cell (Tuple[int, int]): Target cell coordinates.
+
+        Returns:
+            str: Directions ('N', 'E', 'S', 'W') from the entry; an
+            empty string if the cell can not be reached.
+        """
+        index = self.topology.index(*cell)
+        if not self.parents[index]:
+            return ""
+        return Solver.trace_path(self.parents, self.topology.offset, index)
@@ -0,0 +1,239 @@
+from .grid import Grid, Wall
+from typing import Tuple
+
+# Translate a '0'/'1' bit string into one byte per bit holding the
+# corresponding wall flag
+_SPREAD = {
+    wall: bytes(wall if char == ord("1") else 0 for char in range(256))
+    for wall in Wall
+}
+# Translate cell values into a '0'/'1' bit string of one wall flag
+_GATHER = {
+    wall: bytes(ord("1") if value & wall else ord("0")
+                for value in range(256))
+    for wall in Wall
+}
+
+
+def _bit_span(bits: bytearray, start: int, count: int) -> int:
+    """
+    Return ``count`` bits of a bitset starting at bit ``start``
+    as an integer (first bit is the least significant).
+    """
+    value = int.from_bytes(bits[start >> 3:(start + count + 7) >> 3],
+                           "little")
+    return (value >> (start & 7)) & ((1 << count) - 1)
+
+
+def _set_bit_span(bits: bytearray, start: int, count: int,
+                  value: int) -> None:
+    """
+    Overwrite ``count`` bits of a bitset starting at bit ``start``
+    with an integer (first bit is the least significant).
+    """
+    first, end = start >> 3, (start + count + 7) >> 3
+    shift = start & 7
+    word = int.from_bytes(bits[first:end], "little")
+    word &= ~(((1 << count) - 1) << shift)
+    word |= value << shift
+    bits[first:end] = word.to_bytes(end - first, "little")
+
+
+def _gather(cells: bytes | bytearray, wall: Wall) -> int:
+    """
+    Collect one wall flag of every cell into an integer, bit ``i``
+    being set when cell ``i`` has ``wall`` closed (inverse of
+    ``_spread()``).
+    """
+    return int(cells.translate(_GATHER[wall])[::-1], 2)
+
+
+def _spread(value: int, count: int, wall: Wall) -> int:
+    """
+    Expand ``count`` bits into ``count`` bytes (big-endian integer),
+    byte ``i`` holding ``wall`` when bit ``i`` is set.
+    """
+    digits = format(value, f"0{count}b")[::-1].encode()
+    return int.from_bytes(digits.translate(_SPREAD[wall]), "big")
+
+
+class EdgeGrid(Grid):
+    """
+    Grid storing each physical wall exactly once.
+
+    Walls live in two bitsets instead of per-cell nibbles:
+
+        h_walls: (height + 1) x width bits, bit (row, col) is the wall
+            on the NORTH side of cell (row, col), i.e. the SOUTH side
+            of cell (row - 1, col).
+        v_walls: height x (width + 1) bits, bit (row, col) is the wall
+            on the WEST side of cell (row, col), i.e. the EAST side
+            of cell (row, col - 1).
+
+    A bit value of 1 means the wall is CLOSED. Neighbouring cells can
+    never disagree on a shared wall, ``open_passage()`` is a single bit
+    write, and bulk queries such as ``count_walls()`` run over whole
+    machine words. The 4-bit cell encoding is projected on demand by
+    ``get()`` / ``get_row()``, so Solver and OutputWriter work as is.
+
+    Note that ``clear_wall()`` and ``set()`` also change the neighbour
+    sharing the wall.
+    """
+    h_walls: bytearray
+    v_walls: bytearray
+
+    def _allocate(self) -> bytearray:
+        """
+        Create both wall bitsets with every wall closed.
+        """
+        self._h_bits = (self.height + 1) * self.width
+        self._v_bits = self.height * (self.width + 1)
+        self.h_walls = bytearray((self._h_bits + 7) >> 3)
+        self.v_walls = bytearray((self._v_bits + 7) >> 3)
+        self._close_all()
+        return bytearray()
+
+    def _close_all(self) -> None:
+        """
+        Set every wall bit, leaving the padding bits clear.
+        """
+        for bits, count in ((self.h_walls, self._h_bits),
+                            (self.v_walls, self._v_bits)):
+            bits[:] = b"\xff" * len(bits)
+            if count & 7:
+                bits[-1] = (1 << (count & 7)) - 1
+
+    def _wall_bit(self, row: int, col: int,
+                  wall: int) -> Tuple[bytearray, int]:
+        """
+        Return the bitset and bit index holding a wall of (row, col).
+        """
+        if wall == Wall.NORTH:
+            return self.h_walls, row * self.width + col
+        if wall == Wall.SOUTH:
+            return self.h_walls, (row + 1) * self.width + col
+        if wall == Wall.WEST:
+            return self.v_walls, row * (self.width + 1) + col
+        return self.v_walls, row * (self.width + 1) + col + 1
+
+    def get(self, row: int, col: int) -> int:
+        """
+        Return the 4-bit wall value of (row, col) built from the
+        two bitsets.
+        """
+        h_walls, v_walls = self.h_walls, self.v_walls
+        north = row * self.width + col
+        south = north + self.width
+        west = row * (self.width + 1) + col
+        east = west + 1
+        return (h_walls[north >> 3] >> (north & 7) & 1) |\
+            (v_walls[east >> 3] >> (east & 7) & 1) << 1 |\
+            (h_walls[south >> 3] >> (south & 7) & 1) << 2 |\
+            (v_walls[west >> 3] >> (west & 7) & 1) << 3
+
+    def set(self, row: int, col: int, value: int) -> None:
+        """
+        Write the four walls of (row, col) from a 4-bit value.
+        This also updates the neighbours sharing those walls.
+        """
+        for wall in Wall:
+            bits, bit = self._wall_bit(row, col, wall)
+            if value & wall:
+                bits[bit >> 3] |= 1 << (bit & 7)
+            else:
+                bits[bit >> 3] &= ~(1 << (bit & 7))
+
+    def get_at(self, index: int) -> int:
+        """
+        Return the wall value of the cell at a flat index.
+        """
+        return self.get(*divmod(index, self.width))
+
+    def set_at(self, index: int, value: int) -> None:
+        """
+        Store the wall value of the cell at a flat index.
+        """
+        self.set(*divmod(index, self.width), value)
+
+    def clear_wall(self, row: int, col: int, wall: int) -> None:
+        """
+        Open the given wall of (row, col). The wall is shared, so the
+        neighbour behind it is opened as well.
+        """
+        bits, bit = self._wall_bit(row, col, wall)
+        bits[bit >> 3] &= ~(1 << (bit & 7))
+
+    def clear_wall_at(self, index: int, wall: int) -> None:
+        """
+        Open the given wall of the cell at a flat index (shared with
+        the neighbour behind it).
+        """
+        self.clear_wall(*divmod(index, self.width), wall)
+
+    def open_passage(self, row: int, col: int, wall: Wall) -> None:
+        """
+        Open the passage between (row, col) and its neighbour with a
+        single bit write.
+        """
+        self.clear_wall(row, col, wall)
+
+    def open_passage_at(self, index: int, wall: Wall) -> None:
+        """
+        Open the passage between the cell at a flat index and its
+        neighbour with a single bit write.
+        """
+        self.clear_wall(*divmod(index, self.width), wall)
+
+    def get_row(self, row: int) -> bytes:
+        """
+        Project one row to the 4-bit cell encoding, one byte per cell,
+        using whole-row bit operations.
+        """
+        width = self.width
+        north = _bit_span(self.h_walls, row * width, width)
+        south = _bit_span(self.h_walls, (row + 1) * width, width)
+        verticals = _bit_span(self.v_walls, row * (width + 1), width + 1)
+        west = verticals & ((1 << width) - 1)
+        east = verticals >> 1
+        cells = _spread(north, width, Wall.NORTH) |\
+            _spread(east, width, Wall.EAST) |\
+            _spread(south, width, Wall.SOUTH) |\
+            _spread(west, width, Wall.WEST)
+        return cells.to_bytes(width, "big")
+
+    def set_rows(self, row: int, values: bytes | bytearray) -> None:
+        """
+        Store the wall values of consecutive rows with whole-row bit
+        operations (inverse of ``get_row()``).
+
+        As with ``set()`` called cell by cell, a wall shared by two
+        cells of ``values`` takes the value of the later cell.
+        """
+        width = self.width
+        for first in range(0, len(values), width):
+            cells = values[first:first + width]
+            count = len(cells)
+            # The north bits overwrite the south bits of the previous row
+            _set_bit_span(self.h_walls, row * width, count,
+                          _gather(cells, Wall.NORTH))
+            _set_bit_span(self.h_walls, (row + 1) * width, count,
+                          _gather(cells, Wall.SOUTH))
+            # West bits, then the east wall of the last cell
+            _set_bit_span(self.v_walls, row * (width + 1), count + 1,
+                          _gather(cells, Wall.WEST)
+                          | (cells[-1] >> 1 & 1) << count)
+            row += 1
+
+    def count_walls(self) -> int:
+        """
+        Return the number of closed physical walls (border included)
+        with one popcount per bitset.
+        """
+        return int.from_bytes(self.h_walls, "little").bit_count() +\
+            int.from_bytes(self.v_walls, "little").bit_count()
+
+    def reset_cells(self) -> None:
+        """
+        Close every wall again.
+        """
+        self._close_all()
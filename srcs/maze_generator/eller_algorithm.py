@@ -0,0 +1,291 @@
+from .abc_algorithm import Algorithm
+from .grid import Grid, Wall
+from typing import Dict, Iterator, List, Set
+
+# Chance of joining two neighbouring sets / of carving a cell downwards
+_JOIN_CHANCE = 0.5
+
+
+class EllerAlgorithm(Algorithm):
+    """
+    Eller's maze generation algorithm.
+
+    The maze is built one row at a time. Each cell of the current row
+    belongs to a set of cells already connected above it; neighbouring
+    cells of different sets are randomly joined, then every set carves
+    at least one passage down into the next row. A finished row never
+    changes again, so `iter_rows()` yields it immediately and only
+    O(width) state is kept: the set of each cell of the current row.
+
+    The reserved '42' cells split rows into segments that can only be
+    joined through other rows. Before carving down, the free cells of
+    the rows below are grouped into the areas that can still reach
+    each other; sets and areas are then connected (extra carves or
+    joins) so that every set ends up in the spanning tree. This look
+    ahead only covers the rows down to the one following the last
+    reserved cell.
+
+    When `perfect` is False, some walls between cells of the same set
+    are opened as well, which creates cycles.
+
+    `generate()` fills `grid` from `iter_rows()`. For mazes too tall to
+    keep in memory, pass `iter_rows()` to
+    `OutputWriter.create_streaming_output()` instead: the grid is then
+    never allocated.
+    """
+
+    def generate(self) -> Grid:
+        """
+        Generate the maze grid.
+
+        Steps:
+            1. Reset all grid cells to their initial state.
+            2. Store each row yielded by `iter_rows()`.
+
+        Returns:
+            Grid: The generated maze grid.
+        """
+        grid = self.grid
+        grid.reset_cells()
+        for row, cells in enumerate(self.iter_rows()):
+            grid.set_row(row, cells)
+        return grid
+
+    def iter_rows(self) -> Iterator[bytes]:
+        """
+        Generate the maze row by row.
+
+        The random stream is restarted from the seed (if provided) when
+        iteration starts.
+
+        Yields:
+            bytes: Wall values of each row, top to bottom, one byte
+            per cell.
+        """
+        width, height = self.width, self.height
+        self.reset_rng()
+        self._blocked_rows: Dict[int, Set[int]] = {}
+        for row, col in self.reserved_cells():
+            self._blocked_rows.setdefault(row, set()).add(col)
+        self._last_blocked = max(self._blocked_rows, default=0)
+
+        self._next_set = 1
+        sets = self.new_row_sets(0, [0] * width)
+        carved: List[int] = []
+        for row in range(height):
+            cells = bytearray(b"\x0f") * width
+            for col in carved:
+                cells[col] &= ~Wall.NORTH
+            members = self.group_members(sets)
+            last = row + 1 == height
+            self.join_row(cells, sets, members, 1.0 if last else _JOIN_CHANCE)
+            if last:
+                carved = []
+            else:
+                carved = self.carve_down(row, cells, sets, members)
+            if not self.perfect:
+                self.add_row_loops(cells, sets)
+            yield bytes(cells)
+            if not last:
+                below = [0] * width
+                for col in carved:
+                    below[col] = sets[col]
+                sets = self.new_row_sets(row + 1, below)
+
+    def new_row_sets(self, row: int, sets: List[int]) -> List[int]:
+        """
+        Give a new set to every free cell of a row not carved into
+        from above. Reserved cells keep set 0.
+        """
+        blocked = self._blocked_rows.get(row, ())
+        for col, cell_set in enumerate(sets):
+            if not cell_set and col not in blocked:
+                sets[col] = self._next_set
+                self._next_set += 1
+        return sets
+
+    @staticmethod
+    def group_members(sets: List[int]) -> Dict[int, List[int]]:
+        """
+        Return the columns of each set of a row, in column order.
+        """
+        members: Dict[int, List[int]] = {}
+        for col, cell_set in enumerate(sets):
+            if cell_set:
+                members.setdefault(cell_set, []).append(col)
+        return members
+
+    @staticmethod
+    def merge(sets: List[int], members: Dict[int, List[int]],
+              first: int, second: int) -> int:
+        """
+        Merge two sets of a row, relabelling the smaller one.
+
+        Returns:
+            int: Label of the merged set.
+        """
+        if len(members[first]) < len(members[second]):
+            first, second = second, first
+        moved = members.pop(second)
+        for col in moved:
+            sets[col] = first
+        members[first].extend(moved)
+        return first
+
+    def join_row(self, cells: bytearray, sets: List[int],
+                 members: Dict[int, List[int]], chance: float) -> None:
+        """
+        Randomly open the walls between neighbouring cells of
+        different sets.
+        """
+        rand = self.rng.random
+        for col in range(self.width - 1):
+            first, second = sets[col], sets[col + 1]
+            if first and second and first != second and rand() < chance:
+                cells[col] &= ~Wall.EAST
+                cells[col + 1] &= ~Wall.WEST
+                self.merge(sets, members, first, second)
+
+    def carve_down(self, row: int, cells: bytearray, sets: List[int],
+                   members: Dict[int, List[int]]) -> List[int]:
+        """
+        Choose the passages between a row and the next one.
+
+        Every set carves down at random, at least once when it can.
+        When the next row holds reserved cells, sets and areas of the
+        rows below that are still apart are then linked
+        (see `link_areas()`).
+
+        Returns:
+            List[int]: Columns whose SOUTH wall was opened.
+        """
+        rand = self.rng.random
+        areas = self.areas_below(row)
+        carved = bytearray(self.width)
+        for cols in members.values():
+            chosen = False
+            for col in cols:
+                if areas[col] >= 0 and rand() < _JOIN_CHANCE:
+                    carved[col] = 1
+                    chosen = True
+            if not chosen:
+                candidates = [col for col in cols if areas[col] >= 0]
+                if candidates:
+                    carved[self.rng.choice(candidates)] = 1
+        if row + 1 in self._blocked_rows:
+            self.link_areas(cells, sets, members, areas, carved)
+
+        down = [col for col in range(self.width) if carved[col]]
+        for col in down:
+            cells[col] &= ~Wall.SOUTH
+        return down
+
+    def link_areas(self, cells: bytearray, sets: List[int],
+                   members: Dict[int, List[int]], areas: List[int],
+                   carved: bytearray) -> None:
+        """
+        Add carves and joins until every set and every area of the
+        rows below are connected, when the reserved cells allow it.
+
+        Sets and areas are the nodes of a small union-find (areas use
+        negative labels); a carve links a set to an area, a join links
+        two sets.
+        """
+        parent: Dict[int, int] = {}
+
+        def find(node: int) -> int:
+            parent.setdefault(node, node)
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for col in range(self.width):
+            if sets[col]:
+                find(sets[col])
+                if areas[col] >= 0:
+                    find(-1 - areas[col])
+                    if carved[col]:
+                        parent[find(sets[col])] = find(-1 - areas[col])
+        changed = True
+        while changed and len({find(node) for node in parent}) > 1:
+            changed = False
+            for col in range(self.width):
+                cell_set = sets[col]
+                if cell_set and areas[col] >= 0 and not carved[col] and\
+                        find(cell_set) != find(-1 - areas[col]):
+                    carved[col] = 1
+                    parent[find(cell_set)] = find(-1 - areas[col])
+                    changed = True
+            for col in range(self.width - 1):
+                first, second = sets[col], sets[col + 1]
+                if first and second and first != second and\
+                        find(first) != find(second):
+                    self.open_east(cells, col)
+                    parent[find(first)] = find(second)
+                    self.merge(sets, members, first, second)
+                    changed = True
+
+    def areas_below(self, row: int) -> List[int]:
+        """
+        Label the cells of the next row by the area of free cells
+        (rows below `row`) they belong to.
+
+        A next row without reserved cells connects all of them, so
+        only the rows from a row with reserved cells down to the one
+        following the last reserved row are ever flooded.
+
+        Returns:
+            List[int]: Area label per column, -1 for a reserved cell.
+        """
+        width = self.width
+        if row + 1 not in self._blocked_rows:
+            return [0] * width
+        top = row + 1
+        bottom = min(self._last_blocked + 1, self.height - 1)
+        rows = bottom - top + 1
+        free = bytearray(b"\x01") * (rows * width)
+        for blocked_row, cols in self._blocked_rows.items():
+            if top <= blocked_row <= bottom:
+                for col in cols:
+                    free[(blocked_row - top) * width + col] = 0
+        labels = [-1] * (rows * width)
+        label = 0
+        for start in range(width):
+            if not free[start] or labels[start] >= 0:
+                continue
+            labels[start] = label
+            stack = [start]
+            while stack:
+                index = stack.pop()
+                line, col = divmod(index, width)
+                for other, inside in ((index - width, line > 0),
+                                      (index + width, line + 1 < rows),
+                                      (index - 1, col > 0),
+                                      (index + 1, col + 1 < width)):
+                    if inside and free[other] and labels[other] < 0:
+                        labels[other] = label
+                        stack.append(other)
+            label += 1
+        return labels[:width]
+
+    def add_row_loops(self, cells: bytearray, sets: List[int]) -> None:
+        """
+        Open closed walls between neighbouring cells that are already
+        connected, each with probability `loop_density`, creating
+        cycles.
+        """
+        density = self.loop_density
+        rand = self.rng.random
+        for col in range(self.width - 1):
+            if sets[col] and sets[col] == sets[col + 1] and\
+                    cells[col] & Wall.EAST and rand() < density:
+                self.open_east(cells, col)
+
+    @staticmethod
+    def open_east(cells: bytearray, col: int) -> None:
+        """
+        Open the wall between a cell and its east neighbour in a row.
+        """
+        cells[col] &= ~Wall.EAST
+        cells[col + 1] &= ~Wall.WEST
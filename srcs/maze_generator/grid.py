@@ -1,5 +1,16 @@
-from typing import List
-from enum import IntEnum
+from typing import Iterator, overload
+from collections.abc import Sequence
+from .topology import OPPOSITE, Wall, wall_offsets
+
+# Lookup tables splitting a packed byte into its two cells
+_LOW_NIBBLE = bytes(value & 0x0F for value in range(256))
+_HIGH_NIBBLE = bytes(value >> 4 for value in range(256))
+# Cell value moved to the high nibble of a packed byte
+_TO_HIGH_NIBBLE = bytes((value & 0x0F) << 4 for value in range(256))
+# Closed north/west walls of a cell, and closed south wall, by cell value
+_NORTH_WEST_COUNT = bytes((value & 1) + (value >> 3 & 1)
+                          for value in range(256))
+_SOUTH_COUNT = bytes(value >> 2 & 1 for value in range(256))
 
 
 class Grid:
@@ -17,11 +28,23 @@ class Grid:
     A bit value of 1 means the wall is CLOSED.
     A bit value of 0 means the wall is OPEN.
 
+    Cells are stored row by row in one contiguous ``bytearray``
+    (one byte per cell). The ``cells`` attribute exposes the same
+    data as a matrix of row views, so ``cells[row][col]`` keeps
+    working for code written against the former ``List[List[int]]``.
+
     During initialization, cells are set to 15.
     The value 15 indicates that the cell has four closed doors (1111).
+
+    Subclasses using another storage layout override ``_allocate``,
+    ``get_at``, ``set_at``, ``get_row``, ``set_rows`` and
+    ``clear_wall_at`` (and
+    ``open_passage_at`` / ``count_walls`` when walls are shared).
     """
-    # 2D matrix of cells: cells[row][col]
-    cells: List[List[int]]
+    # Flat row-major storage: cell (row, col) lives at row * width + col
+    buffer: bytearray
+    # Byte pattern written to every buffer byte by reset_cells()
+    _FILL = b"\x0f"
 
     def __init__(self, width: int, height: int):
         """
@@ -32,27 +55,157 @@ class Grid:
         """
         self.width = width
         self.height = height
+        # Total number of cells in the grid
+        self.cells_count = width * height
+        # Flat index delta of the neighbour behind each wall value
+        self._steps = wall_offsets(width)
         # Initialize all cells to 15
-        self.cells = [[15 for _ in range(width)] for _ in range(height)]
+        self.buffer = self._allocate()
         # Store grid center coordinates (row, column)
         # Useful for positioning the "42" pattern
         self.center = tuple([height // 2, width // 2])
-        # Total number of cells in the grid
-        self.cells_count = width * height
+
+    def _allocate(self) -> bytearray:
+        """
+        Create the cell storage with every cell fully closed.
+        """
+        return bytearray(self._FILL) * self.cells_count
+
+    @property
+    def cells(self) -> "CellsView":
+        """
+        2D view of the grid: ``cells[row][col]``.
+
+        Reading and writing through the view goes straight to the
+        underlying buffer, no copy is made.
+        """
+        return CellsView(self)
+
+    def index(self, row: int, col: int) -> int:
+        """
+        Return the flat buffer index of the cell at (row, col).
+        """
+        return row * self.width + col
+
+    def get_at(self, index: int) -> int:
+        """
+        Return the wall value of the cell at a flat index.
+        """
+        return self.buffer[index]
+
+    def set_at(self, index: int, value: int) -> None:
+        """
+        Store the wall value of the cell at a flat index.
+        """
+        self.buffer[index] = value
+
+    def get(self, row: int, col: int) -> int:
+        """
+        Return the wall value of the cell at (row, col).
+        """
+        return self.get_at(row * self.width + col)
+
+    def set(self, row: int, col: int, value: int) -> None:
+        """
+        Store the wall value of the cell at (row, col).
+        """
+        self.set_at(row * self.width + col, value)
+
+    def get_row(self, row: int) -> bytes:
+        """
+        Return the wall values of one row as ``bytes``
+        (one byte per cell).
+        """
+        start = row * self.width
+        return bytes(self.buffer[start:start + self.width])
+
+    def set_row(self, row: int, values: bytes | bytearray) -> None:
+        """
+        Store the wall values of one row from ``bytes``
+        (one byte per cell).
+        """
+        self.set_rows(row, values)
+
+    def set_rows(self, row: int, values: bytes | bytearray) -> None:
+        """
+        Store the wall values of consecutive rows, starting at `row`,
+        from ``bytes`` (one byte per cell, rows concatenated).
+        """
+        start = row * self.width
+        self.buffer[start:start + len(values)] = values
+
+    def has_wall(self, row: int, col: int, wall: int) -> bool:
+        """
+        Return True if the given wall of cell (row, col) is closed.
+        """
+        return self.get_at(row * self.width + col) & wall != 0
+
+    def clear_wall(self, row: int, col: int, wall: int) -> None:
+        """
+        Open the given wall of cell (row, col).
+
+        Only this cell is updated; the neighbour sharing the wall
+        must be updated separately.
+        """
+        self.clear_wall_at(row * self.width + col, wall)
+
+    def clear_wall_at(self, index: int, wall: int) -> None:
+        """
+        Open the given wall of the cell at a flat index
+        (this cell only).
+        """
+        self.buffer[index] &= ~wall
+
+    def open_passage(self, row: int, col: int, wall: Wall) -> None:
+        """
+        Open a wall on both sides: in cell (row, col) and in the
+        neighbour behind it.
+
+        Args:
+            row (int): Cell row.
+            col (int): Cell column.
+            wall (Wall): Wall of (row, col) to open. The neighbour must
+                be inside the grid.
+        """
+        self.open_passage_at(row * self.width + col, wall)
+
+    def open_passage_at(self, index: int, wall: Wall) -> None:
+        """
+        Open a wall on both sides, the cell being given by its flat
+        index. The neighbour must be inside the grid.
+        """
+        self.clear_wall_at(index, wall)
+        self.clear_wall_at(index + self._steps[wall], OPPOSITE[wall])
+
+    def count_walls(self) -> int:
+        """
+        Return the number of closed physical walls, counting a wall
+        shared by two cells once (border walls included).
+
+        Each row is counted with a lookup-table translation; the
+        north and west bits of every cell plus the outer south and
+        east borders cover every physical wall exactly once.
+        """
+        total = 0
+        for row in range(self.height):
+            total += sum(self.get_row(row).translate(_NORTH_WEST_COUNT))
+            total += self.get(row, self.width - 1) >> 1 & 1
+        total += sum(self.get_row(self.height - 1).translate(_SOUTH_COUNT))
+        return total
 
     def reset_cells(self) -> None:
         """
         Reset all grid cells to their default value.
 
-        Reinitializes the internal 2D grid structure so that every cell
+        Fills the whole buffer in a single operation so that every cell
         is set to 15 (0xF in hexadecimal), which represents a fully
-        closed cell with all walls present.
+        closed cell with all walls present. The buffer itself is
+        reused, nothing is reallocated.
 
         This method is typically used before generating or regenerating
         a maze to ensure a clean initial state.
         """
-        self.cells = [
-            [15 for _ in range(self.width)] for _ in range(self.height)]
+        self.buffer[:] = self._FILL * len(self.buffer)
 
     def __str__(self) -> str:
         """
@@ -62,38 +215,208 @@ class Grid:
         return "\n".join([str(row) for row in self.cells])
 
 
-class Wall(IntEnum):
+class PackedGrid(Grid):
+    """
+    Grid storing two cells per byte.
+
+    Each cell only needs 4 bits, so cell ``i`` lives in the low
+    nibble (even ``i``) or the high nibble (odd ``i``) of
+    ``buffer[i // 2]``. This halves memory compared to ``Grid`` at
+    the cost of a little bit twiddling per access. Values are stored
+    modulo 16.
+
+    Select it with ``MazeGenerator(..., grid_factory=PackedGrid)``.
+    """
+    _FILL = b"\xff"
+
+    def _allocate(self) -> bytearray:
+        """
+        Create the packed storage with every cell fully closed.
+        """
+        return bytearray(self._FILL) * ((self.cells_count + 1) // 2)
+
+    def get_at(self, index: int) -> int:
+        """
+        Return the wall value of the cell at a flat index.
+        """
+        if index & 1:
+            return self.buffer[index >> 1] >> 4
+        return self.buffer[index >> 1] & 0x0F
+
+    def set_at(self, index: int, value: int) -> None:
+        """
+        Store the wall value of the cell at a flat index.
+        """
+        byte = index >> 1
+        if index & 1:
+            self.buffer[byte] = (self.buffer[byte] & 0x0F) |\
+                ((value & 0x0F) << 4)
+        else:
+            self.buffer[byte] = (self.buffer[byte] & 0xF0) | (value & 0x0F)
+
+    def get_row(self, row: int) -> bytes:
+        """
+        Return the wall values of one row as ``bytes``
+        (one byte per cell), unpacking the nibbles in bulk.
+        """
+        start = row * self.width
+        packed = self.buffer[start >> 1:(start + self.width + 1) >> 1]
+        unpacked = bytearray(2 * len(packed))
+        unpacked[0::2] = packed.translate(_LOW_NIBBLE)
+        unpacked[1::2] = packed.translate(_HIGH_NIBBLE)
+        skip = start & 1
+        return bytes(unpacked[skip:skip + self.width])
+
+    def set_rows(self, row: int, values: bytes | bytearray) -> None:
+        """
+        Store the wall values of consecutive rows. Whole bytes are
+        packed in bulk (`pack_cells()`); only a cell sharing its byte
+        with a cell outside the span, at either end, is written on its
+        own.
+        """
+        start = row * self.width
+        end = start + len(values)
+        first, last = 0, len(values)
+        if start & 1 and first < last:
+            self.set_at(start, values[0])
+            first += 1
+        if end & 1 and first < last:
+            self.set_at(end - 1, values[-1])
+            last -= 1
+        if first < last:
+            byte = (start + first) >> 1
+            self.buffer[byte:byte + ((last - first) >> 1)] = \
+                pack_cells(values[first:last])
+
+    def clear_wall_at(self, index: int, wall: int) -> None:
+        """
+        Open the given wall of the cell at a flat index with a single
+        in-place update of its nibble.
+        """
+        if index & 1:
+            self.buffer[index >> 1] &= ~(wall << 4)
+        else:
+            self.buffer[index >> 1] &= ~wall
+
+
+def pack_cells(values: bytes | bytearray) -> bytes:
+    """
+    Pack cell values (one byte per cell) two per byte, in the
+    `PackedGrid.buffer` layout.
+    """
+    if len(values) & 1:
+        values = bytes(values) + b"\x0f"
+    low = values[0::2].translate(_LOW_NIBBLE)
+    high = values[1::2].translate(_TO_HIGH_NIBBLE)
+    return (int.from_bytes(low, "little") |
+            int.from_bytes(high, "little")).to_bytes(len(low), "little")
+
+
+def unpack_cells(packed: bytes | bytearray, count: int) -> bytes:
+    """
+    Return the first `count` cell values of packed bytes, one byte per
+    cell (inverse of `pack_cells()`).
     """
-    Represents the four walls of a grid cell.
+    unpacked = bytearray(2 * len(packed))
+    unpacked[0::2] = packed.translate(_LOW_NIBBLE)
+    unpacked[1::2] = packed.translate(_HIGH_NIBBLE)
+    return bytes(unpacked[:count])
 
-    Each wall is encoded as a power of two so it can be used
-    as a bit flag inside a single integer (0-15).
 
-    Bit representation:
-        NORTH = 0001
-        EAST  = 0010
-        SOUTH = 0100
-        WEST  = 1000
+class RowView(Sequence[int]):
+    """
+    Mutable view over one row of a Grid.
 
-    This design allows efficient wall manipulation using
-    bitwise operations (&, |, ~).
+    Behaves like the ``List[int]`` rows of the former nested-list
+    storage: supports indexing (including negative indices),
+    item assignment, ``len()`` and iteration.
     """
-    NORTH = 1
-    EAST = 2
-    SOUTH = 4
-    WEST = 8
 
-    def opposite(self) -> "Wall":
+    def __init__(self, grid: Grid, row: int) -> None:
+        """
+        Args:
+            grid (Grid): Grid owning the data.
+            row (int): Row index (already normalized).
+        """
+        self._grid = grid
+        self._start = row * grid.width
+
+    def _normalize(self, col: int) -> int:
+        """
+        Convert a (possibly negative) column into a flat index.
         """
-        Return the opposite wall.
+        width = self._grid.width
+        if col < 0:
+            col += width
+        if not 0 <= col < width:
+            raise IndexError("grid column out of range")
+        return self._start + col
+
+    @overload
+    def __getitem__(self, col: int) -> int:
+        ...
+
+    @overload
+    def __getitem__(self, col: slice) -> list[int]:
+        ...
+
+    def __getitem__(self, col: int | slice) -> int | list[int]:
+        if isinstance(col, slice):
+            return list(self)[col]
+        return self._grid.get_at(self._normalize(col))
+
+    def __setitem__(self, col: int, value: int) -> None:
+        self._grid.set_at(self._normalize(col), value)
+
+    def __len__(self) -> int:
+        return self._grid.width
 
-        Useful when removing a wall between two adjacent cells.
-        Example:
-            If you open the EAST wall of the current cell,
-            you must also open the WEST wall of the neighboring cell.
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._grid.get_row(self._start // self._grid.width))
+
+    def __repr__(self) -> str:
+        return str(list(self))
+
+
+class CellsView(Sequence[RowView]):
+    """
+    Read-only sequence of RowView objects, one per grid row.
+
+    ``len(view)`` is the grid height and ``view[row][col]`` addresses
+    a single cell, mirroring the former ``List[List[int]]`` layout.
+    """
+
+    def __init__(self, grid: Grid) -> None:
         """
-        return {
-            Wall.NORTH: Wall.SOUTH,
-            Wall.SOUTH: Wall.NORTH,
-            Wall.EAST: Wall.WEST,
-            Wall.WEST: Wall.EAST}[self]
+        Args:
+            grid (Grid): Grid owning the data.
+        """
+        self._grid = grid
+
+    @overload
+    def __getitem__(self, row: int) -> RowView:
+        ...
+
+    @overload
+    def __getitem__(self, row: slice) -> list[RowView]:
+        ...
+
+    def __getitem__(self, row: int | slice) -> RowView | list[RowView]:
+        height = self._grid.height
+        if isinstance(row, slice):
+            return [RowView(self._grid, r)
+                    for r in range(*row.indices(height))]
+        if row < 0:
+            row += height
+        if not 0 <= row < height:
+            raise IndexError("grid row out of range")
+        return RowView(self._grid, row)
+
+    def __len__(self) -> int:
+        return self._grid.height
+
+    def __iter__(self) -> Iterator[RowView]:
+        return (RowView(self._grid, r) for r in range(self._grid.height))
+
+    def __repr__(self) -> str:
+        return repr([list(row) for row in self])
@@ -0,0 +1,193 @@
+from .abc_algorithm import DEFAULT_BATCH_SIZE, Algorithm
+from .grid import Grid, Wall
+from typing import Iterator
+from array import array
+from itertools import compress
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_NUMPY = False
+
+# Per-value tables: 1 if the east / south wall bit is set, else 0
+_EAST_FLAG = bytes(value >> 1 & 1 for value in range(256))
+_SOUTH_FLAG = bytes(value >> 2 & 1 for value in range(256))
+
+
+class KruskalAlgorithm(Algorithm):
+    """
+    Randomized Kruskal maze generation algorithm.
+
+    Every interior wall between two non-'42' cells is an edge
+    candidate. The candidates are shuffled in bulk and opened in that
+    order whenever they join two cells that are not connected yet,
+    which produces a perfect maze (a random spanning tree).
+
+    Connectivity is tracked with a disjoint set stored in flat arrays
+    (``array('i')`` parents, ``bytearray`` ranks) using path halving
+    and union by rank. There is no DFS stack, so memory only depends
+    on the grid size. When `perfect` is False, additional walls are
+    removed afterwards exactly like `PerfectAlgorithm` does.
+
+    Edges are encoded as ``index * 2`` for the EAST wall of a cell and
+    ``index * 2 + 1`` for its SOUTH wall. Arrays use 4-byte items
+    unless the grid is too large for them.
+    """
+
+    def generate(self) -> Grid:
+        """
+        Generate the maze grid by driving `iter_generate()` to
+        completion.
+
+        Returns:
+            Grid: The generated maze grid.
+        """
+        for _ in self.iter_generate():
+            pass
+        return self.grid
+
+    def iter_generate(self, batch_size: int = DEFAULT_BATCH_SIZE
+                      ) -> Iterator[array]:
+        """
+        Generate the maze grid step by step, yielding carve events.
+
+        Steps:
+            1. Reset all grid cells to their initial state.
+            2. Restart the random stream from the seed (if provided).
+            3. Reserve special "42" cells if possible.
+            4. Shuffle the interior edges and join disjoint sets.
+            5. Optionally remove additional walls if
+               non-perfect mode is enabled.
+
+        Args:
+            batch_size (int): Maximum number of events per batch.
+
+        Yields:
+            array: Carve events (``index << 4 | wall``, see
+            `decode_event()`), in carving order.
+        """
+        self.grid.reset_cells()
+        self.reset_rng()
+        cells_42 = self.reserved_cells()
+        blocked = self.new_visited_map(cells_42)
+        edges = self.shuffle_edges(self.build_edges(blocked))
+        yield from self.iter_join_cells(
+            edges, self.topology.size - len(cells_42) - 1, batch_size)
+        if not self.perfect:
+            yield from self.iter_braid(cells_42, batch_size)
+
+    def build_edges(self, blocked: bytearray) -> array:
+        """
+        List every interior wall whose two cells are not reserved.
+
+        The candidate walls come from `inner_walls()` as per-cell
+        masks; the east and south edges are then picked out of the
+        flat ranges of edge codes with `itertools.compress()`, without
+        Python code per cell.
+
+        Args:
+            blocked (bytearray): Per-cell map of reserved cells.
+
+        Returns:
+            array: Encoded edges (``index * 2`` east,
+            ``index * 2 + 1`` south), in increasing order.
+        """
+        size = self.topology.size
+        east, south = self.inner_walls(blocked)
+        walls = (east | south).to_bytes(size, "little")
+        edges = array(self.edge_typecode)
+        edges.extend(compress(range(0, 2 * size, 2),
+                              walls.translate(_EAST_FLAG)))
+        edges.extend(compress(range(1, 2 * size, 2),
+                              walls.translate(_SOUTH_FLAG)))
+        return edges
+
+    def shuffle_edges(self, edges: array) -> array:
+        """
+        Return the edges in a random order.
+
+        One `rng.randbytes()` call draws a 32-bit key per edge and the
+        edges are sorted by key (stable, so equal keys keep the edge
+        order). The sort runs in NumPy when it is installed and falls
+        back to `sorted()` otherwise; both give the same order, so a
+        seed produces the same maze either way.
+
+        Args:
+            edges (array): Encoded edges.
+
+        Returns:
+            array: The same edges, shuffled.
+        """
+        draws = self.rng.randbytes(4 * len(edges))
+        if HAS_NUMPY:
+            codes = np.frombuffer(edges, dtype=edges.typecode)
+            order = np.argsort(np.frombuffer(draws, dtype=np.uint32),
+                               kind="stable")
+            return array(edges.typecode, codes[order].tobytes())
+        keys = array("I", draws)
+        return array(edges.typecode,
+                     map(edges.__getitem__,
+                         sorted(range(len(edges)), key=keys.__getitem__)))
+
+    @property
+    def edge_typecode(self) -> str:
+        """
+        Array typecode able to hold every edge code and cell index.
+        """
+        return "i" if 2 * self.topology.size < 2 ** 31 else "q"
+
+    def iter_join_cells(self, edges: array, needed: int,
+                        batch_size: int = DEFAULT_BATCH_SIZE
+                        ) -> Iterator[array]:
+        """
+        Open edges, in order, that connect two disjoint sets.
+
+        Args:
+            edges (array): Encoded edges, already shuffled.
+            needed (int): Number of passages of a spanning tree; the
+                scan stops once they are all opened.
+            batch_size (int): Maximum number of events per batch.
+
+        Yields:
+            array: Carve events of the opened edges.
+        """
+        width = self.width
+        grid = self.grid
+        parent = array(self.edge_typecode, range(self.topology.size))
+        rank = bytearray(self.topology.size)
+        opened = 0
+        batch = array("q")
+        for edge in edges:
+            if opened >= needed:
+                break
+            cell = edge >> 1
+            if edge & 1:
+                wall = Wall.SOUTH
+                other = cell + width
+            else:
+                wall = Wall.EAST
+                other = cell + 1
+            root_a = cell
+            while parent[root_a] != root_a:
+                parent[root_a] = parent[parent[root_a]]
+                root_a = parent[root_a]
+            root_b = other
+            while parent[root_b] != root_b:
+                parent[root_b] = parent[parent[root_b]]
+                root_b = parent[root_b]
+            if root_a == root_b:
+                continue
+            if rank[root_a] < rank[root_b]:
+                root_a, root_b = root_b, root_a
+            parent[root_b] = root_a
+            if rank[root_a] == rank[root_b]:
+                rank[root_a] += 1
+            grid.open_passage_at(cell, wall)
+            opened += 1
+            batch.append(cell << 4 | wall)
+            if len(batch) == batch_size:
+                yield batch
+                batch = array("q")
+        if batch:
+            yield batch
@@ -0,0 +1,130 @@
+from .grid import Grid
+from pathlib import Path
+from types import TracebackType
+import mmap
+import struct
+
+# The cell data starts on its own mapping boundary so it can be mapped
+# with an offset; the first block only holds the header.
+HEADER_SIZE = mmap.ALLOCATIONGRANULARITY
+# Bytes written at once when filling the mapped cells
+_FILL_CHUNK = 1 << 20
+
+_MAGIC = b"MAZEGRD1"
+_HEADER = struct.Struct("<8sQQ")
+
+
+class MappedGrid(Grid):
+    """
+    Grid backed by a memory-mapped file.
+
+    The file starts with a small header (magic, width, height)
+    followed by one byte per cell, in the same row-major layout as
+    ``Grid.buffer``. Only the pages being touched are kept in memory,
+    so mazes larger than physical RAM can be generated and solved.
+
+    The file stays on disk after the grid is closed and can be
+    reopened later with ``MappedGrid.open(path)`` without
+    regenerating the maze.
+
+    Usage with MazeGenerator:
+        ``grid_factory=functools.partial(MappedGrid, path="maze.grid")``
+    """
+    buffer: mmap.mmap  # type: ignore[assignment]
+
+    def __init__(self, width: int, height: int,
+                 path: str | Path, create: bool = True) -> None:
+        """
+        Create (or map an existing) grid file.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+            path (str | Path): File backing the grid.
+            create (bool): When True the file is (re)created with every
+                cell closed; when False an existing file is mapped as is.
+        """
+        self.path = Path(path)
+        self._create = create
+        super().__init__(width, height)
+
+    @classmethod
+    def open(cls, path: str | Path) -> "MappedGrid":
+        """
+        Reopen a grid file previously written by MappedGrid.
+
+        Args:
+            path (str | Path): Grid file.
+
+        Returns:
+            MappedGrid: Grid mapped over the existing file content.
+
+        Raises:
+            ValueError: If the file is not a MappedGrid file.
+        """
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError(f"{path}: not a maze grid file")
+        magic, width, height = _HEADER.unpack(header)
+        if magic != _MAGIC:
+            raise ValueError(f"{path}: not a maze grid file")
+        return cls(width, height, path, create=False)
+
+    def _allocate(self) -> mmap.mmap:  # type: ignore[override]
+        """
+        Create or validate the backing file and map its cell area.
+        """
+        size = HEADER_SIZE + self.cells_count
+        if self._create:
+            with open(self.path, "w+b") as f:
+                f.write(_HEADER.pack(_MAGIC, self.width, self.height))
+                f.truncate(size)
+                buffer = mmap.mmap(f.fileno(), self.cells_count,
+                                   offset=HEADER_SIZE)
+            self._fill(buffer)
+            return buffer
+        with open(self.path, "r+b") as f:
+            if f.seek(0, 2) != size:
+                raise ValueError(f"{self.path}: size does not match "
+                                 f"a {self.width}x{self.height} grid")
+            return mmap.mmap(f.fileno(), self.cells_count,
+                             offset=HEADER_SIZE)
+
+    def _fill(self, buffer: mmap.mmap) -> None:
+        """
+        Close every cell, writing the mapping in fixed-size chunks
+        so no full-size temporary is allocated.
+        """
+        chunk = self._FILL * _FILL_CHUNK
+        for start in range(0, self.cells_count, _FILL_CHUNK):
+            end = min(start + _FILL_CHUNK, self.cells_count)
+            buffer[start:end] = chunk[:end - start]
+
+    def reset_cells(self) -> None:
+        """
+        Reset all grid cells to 15 directly in the mapped file.
+        """
+        self._fill(self.buffer)
+
+    def flush(self) -> None:
+        """
+        Write modified pages back to the file.
+        """
+        self.buffer.flush()
+
+    def close(self) -> None:
+        """
+        Flush and unmap the file. The grid must not be used afterwards.
+        """
+        if not self.buffer.closed:
+            self.buffer.flush()
+            self.buffer.close()
+
+    def __enter__(self) -> "MappedGrid":
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None,
+                 exc: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        self.close()
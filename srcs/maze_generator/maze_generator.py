@@ -1,8 +1,12 @@
 from .grid import Grid
-from .abc_algorithm import Algorithm
-from .perfect_algorithm import PerfectAlgorithm
+from .abc_algorithm import DEFAULT_LOOP_DENSITY, Algorithm
+from .cache import MazeCache
+from .distance_index import DistanceIndex
+from .parallel_algorithm import ParallelAlgorithm
+from .registry import AUTO, create_algorithm, select_algorithm
 from .solver import Solver
-from typing import Tuple
+from .tree_index import TreeIndex
+from typing import Callable, List, Tuple
 
 
 class MazeGenerator():
@@ -26,7 +30,14 @@ class MazeGenerator():
                  width: int, height: int,
                  entry: Tuple[int, int], exit: Tuple[int, int],
                  perfect: bool,
-                 seed: None | str = None) -> None:
+                 seed: None | str = None,
+                 grid_factory: Callable[[int, int], Grid] = Grid,
+                 workers: int | None = None,
+                 tile_size: int = 256,
+                 algorithm: str = "dfs",
+                 loop_density: float = DEFAULT_LOOP_DENSITY,
+                 cache: MazeCache | None = None,
+                 solver: Solver | None = None) -> None:
         """
         Initialize the MazeGenerator.
 
@@ -39,6 +50,31 @@ class MazeGenerator():
                 (i.e., exactly one unique path between any two cells).
             seed (str | None, optional): Optional seed value used
                 for deterministic maze generation.
+            grid_factory (Callable[[int, int], Grid], optional): Grid
+                storage to use, e.g. ``PackedGrid`` to store two cells
+                per byte for very large mazes. Defaults to ``Grid``.
+            workers (int | None, optional): When set, the grid is split
+                into tiles carved by this many worker processes and
+                stitched together (see `ParallelAlgorithm`). The maze
+                only depends on `seed` and `tile_size`, not on the
+                number of workers. Defaults to None (single process).
+            tile_size (int, optional): Side of a tile when `workers`
+                is set. Defaults to 256.
+            algorithm (str, optional): Registered algorithm name
+                (see `mazegen.registry`), or 'auto' to pick one from the
+                calibration table for this size. Ignored when `workers`
+                is set. Defaults to 'dfs'.
+            loop_density (float, optional): Fraction of the closed
+                interior walls opened when `perfect` is False, between
+                0 and 1. Defaults to 0.3.
+            cache (MazeCache | None, optional): On-disk cache consulted
+                before generating a seeded maze, and filled after.
+                Entries are keyed by the solver class as well, since
+                solvers may return different shortest paths. Unseeded
+                mazes are never cached. Defaults to None.
+            solver (Solver | None, optional): Path finder used for the
+                solution, e.g. ``BidirectionalSolver()``. Defaults to
+                a BFS ``Solver()``.
 
         Side Effects:
             - Instantiates the selected Algorithm implementation.
@@ -51,24 +87,142 @@ class MazeGenerator():
         self.exit = exit
         self.perfect = perfect
         self.seed = seed
-        self.algorithm = PerfectAlgorithm(self.width,
-                                          self.height,
-                                          self.entry,
-                                          self.exit,
-                                          self.perfect,
-                                          self.seed)
-        self.solver = Solver()
-        self.grid = self.algorithm.generate()
-        self.solution = self.solver.find_path(self.grid, self.entry, self.exit)
+        self.cache = cache
+        if algorithm == AUTO:
+            algorithm = select_algorithm(width, height, perfect)
+        self.solver = solver if solver is not None else Solver()
+        self.cache_key: str | None = None
+        if cache is not None and seed:
+            # Solvers may pick different shortest paths: the stored
+            # solution is only reused by the same solver class
+            solver_class = type(self.solver)
+            self.cache_key = cache.key(
+                width, height, entry, exit, perfect, seed,
+                algorithm if workers is None else f"parallel/{tile_size}",
+                loop_density,
+                f"{solver_class.__module__}.{solver_class.__qualname__}")
+        if workers is None:
+            self.algorithm = create_algorithm(algorithm,
+                                              self.width,
+                                              self.height,
+                                              self.entry,
+                                              self.exit,
+                                              self.perfect,
+                                              self.seed,
+                                              grid_factory,
+                                              loop_density=loop_density)
+        else:
+            self.algorithm = ParallelAlgorithm(self.width,
+                                               self.height,
+                                               self.entry,
+                                               self.exit,
+                                               self.perfect,
+                                               self.seed,
+                                               grid_factory,
+                                               loop_density=loop_density,
+                                               workers=workers,
+                                               tile_size=tile_size)
+        self._distance_index: DistanceIndex | None = None
+        self._tree_index: TreeIndex | None = None
+        self.generate()
+
+    @property
+    def distance_index(self) -> DistanceIndex:
+        """
+        Distances and shortest paths from the entry to every cell.
+
+        Built by one BFS on first access and kept until the maze
+        changes (`generate()`, `regenerate_region()`), so repeated
+        `distance()` / `path_to()` queries need no new search.
+        """
+        if self._distance_index is None:
+            self._distance_index = DistanceIndex(self.grid, self.entry)
+        return self._distance_index
+
+    @property
+    def tree_index(self) -> TreeIndex:
+        """
+        Distances and paths between any two cells of a perfect maze.
+
+        Built on first access and kept until the maze changes, like
+        `distance_index`.
+
+        Raises:
+            ValueError: If the maze is not perfect.
+        """
+        if not self.perfect:
+            raise ValueError("tree_index needs a perfect maze")
+        if self._tree_index is None:
+            self._tree_index = TreeIndex(self.grid, self.entry)
+        return self._tree_index
 
     def generate(self) -> None:
         """
         Regenerate the maze and recompute its solution.
 
         This method:
-            1. Calls the algorithm to create a new grid.
-            2. Uses the solver to compute the shortest path
+            1. Loads the maze and its solution from the cache, if any
+               and the maze is seeded; otherwise:
+            2. Calls the algorithm to create a new grid.
+            3. Uses the solver to compute the shortest path
                from entry to exit.
+            4. Stores both in the cache, if any.
+
+        The distance and tree indexes of the previous maze are dropped.
         """
+        self._distance_index = None
+        self._tree_index = None
+        if self.cache is not None and self.cache_key is not None:
+            cached = self.cache.load(self.cache_key, self.width * self.height)
+            if cached is not None:
+                cells, self.solution = cached
+                self.grid = self.algorithm.grid
+                self.grid.set_rows(0, cells)
+                return
         self.grid = self.algorithm.generate()
         self.solution = self.solver.find_path(self.grid, self.entry, self.exit)
+        if self.cache is not None and self.cache_key is not None:
+            self.cache.store(self.cache_key,
+                             b"".join(self.grid.get_row(row)
+                                      for row in range(self.height)),
+                             self.solution)
+
+    def regenerate_region(self, top_left: Tuple[int, int],
+                          bottom_right: Tuple[int, int]
+                          ) -> List[Tuple[int, int]]:
+        """
+        Carve a rectangular area of the maze again, keeping the rest.
+
+        The region is re-carved by `Algorithm.recarve_region()`, which
+        keeps it connected to the rest of the maze through the same
+        passages (a perfect maze stays perfect). The solution is only
+        recomputed when the current one goes through the region, or
+        when the maze has loops (a new loop may shorten it).
+
+        Args:
+            top_left (Tuple[int, int]): (row, col) of the first cell.
+            bottom_right (Tuple[int, int]): (row, col) of the last
+                cell, inclusive.
+
+        Returns:
+            List[Tuple[int, int]]: Coordinates of the cells whose walls
+            changed, e.g. for `OutputWriter.update_output()`.
+
+        Raises:
+            ValueError: If the region is empty or not inside the grid.
+        """
+        changed = self.algorithm.recarve_region(top_left, bottom_right)
+        if changed:
+            self._distance_index = None
+            self._tree_index = None
+        top, left = top_left
+        bottom, right = bottom_right
+        crossed = any(
+            top <= index // self.width <= bottom and
+            left <= index % self.width <= right
+            for index in self.solver.path_cells(self.width, self.entry,
+                                                self.solution))
+        if changed and (crossed or not self.perfect):
+            self.solution = self.solver.find_path(self.grid, self.entry,
+                                                  self.exit)
+        return [divmod(index, self.width) for index in changed]
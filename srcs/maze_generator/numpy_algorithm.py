@@ -0,0 +1,309 @@
+from .abc_algorithm import DEFAULT_LOOP_DENSITY, Algorithm
+from .grid import Grid, Wall
+from typing import Any, Callable, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_NUMPY = False
+
+
+class NumpyAlgorithm(Algorithm):
+    """
+    Vectorized binary-tree / sidewinder maze generation using NumPy.
+
+    Every cell points to a parent cell through one of its walls; the
+    root has no parent. A parent-pointer forest where every cell
+    reaches the root is a spanning tree, so opening the wall towards
+    each parent produces a perfect maze. The random choices are drawn
+    as whole-grid arrays and every wall bit is derived with array
+    operations; no Python code runs per cell.
+
+    Styles:
+        "binary_tree": each cell opens NORTH or WEST at random
+            (root in the top-left corner).
+        "sidewinder": the first row is one corridor; in the other rows
+            random east-west runs open NORTH from one random cell each.
+
+    The reserved '42' cells have no parent. Cells cut from the root by
+    them are re-attached, with array operations as well, to a
+    neighbour that still reaches the root.
+
+    NumPy is an optional dependency (``pip install mazegen[numpy]``);
+    creating the algorithm without it raises ImportError.
+    """
+    STYLES = ("binary_tree", "sidewinder")
+
+    def __init__(self, width: int, height: int,
+                 entry: Tuple[int, int], exit: Tuple[int, int],
+                 perfect: bool,
+                 seed: None | str,
+                 grid_factory: Callable[[int, int], Grid] = Grid,
+                 loop_density: float = DEFAULT_LOOP_DENSITY,
+                 style: str = "sidewinder") -> None:
+        """
+        Initialize the algorithm.
+
+        Args:
+            width (int): Maze width.
+            height (int): Maze height.
+            entry (Tuple[int, int]): Entry cell coordinates.
+            exit (Tuple[int, int]): Exit cell coordinates.
+            perfect (bool): Whether the maze must be perfect.
+            seed (None | str): Optional random seed for reproducibility.
+            grid_factory (Callable[[int, int], Grid]): Callable building
+                the grid from (width, height).
+            loop_density (float): Fraction of the closed interior
+                walls opened in non-perfect mazes.
+            style (str): "binary_tree" or "sidewinder".
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If `style` is unknown.
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumpyAlgorithm requires NumPy "
+                              "(pip install mazegen[numpy])")
+        if style not in self.STYLES:
+            raise ValueError(f"unknown style {style!r}, expected one of "
+                             f"{', '.join(self.STYLES)}")
+        super().__init__(width, height, entry, exit, perfect, seed,
+                         grid_factory, loop_density)
+        self.style = style
+
+    def generate(self) -> Grid:
+        """
+        Generate the maze grid.
+
+        Steps:
+            1. Create a NumPy generator from the random stream.
+            2. Reserve special "42" cells if possible.
+            3. Draw the parent direction of every cell.
+            4. Re-attach cells cut off by the "42" cells.
+            5. Derive every wall and store all rows in the grid.
+            6. Optionally open additional walls if
+               non-perfect mode is enabled.
+
+        Returns:
+            Grid: The generated maze grid.
+        """
+        rng = self.numpy_rng()
+        blocked = np.zeros((self.height, self.width), dtype=bool)
+        for row, col in self.reserved_cells():
+            blocked[row, col] = True
+        if self.style == "binary_tree":
+            parents = self.binary_tree_parents(rng)
+        else:
+            parents = self.sidewinder_parents(rng, blocked)
+        self.attach_orphans(rng, parents, blocked)
+        cells = self.walls_from_parents(parents)
+        if not self.perfect:
+            self.add_bulk_loops(rng, cells, blocked)
+        grid = self.grid
+        grid.set_rows(0, cells.tobytes())
+        return grid
+
+    def numpy_rng(self) -> Any:
+        """
+        Return a NumPy random generator seeded from the instance random
+        stream, restarted from `seed` (if provided) first.
+        """
+        self.reset_rng()
+        return np.random.default_rng(self.rng.getrandbits(64))
+
+    def binary_tree_parents(self, rng: Any) -> Any:
+        """
+        Draw NORTH or WEST for every cell; the first row goes WEST,
+        the first column NORTH and the top-left cell is the root.
+        """
+        parents = np.where(rng.random((self.height, self.width)) < 0.5,
+                           np.uint8(Wall.NORTH), np.uint8(Wall.WEST))
+        parents[0, :] = Wall.WEST
+        parents[:, 0] = Wall.NORTH
+        parents[0, 0] = 0
+        return parents
+
+    def sidewinder_parents(self, rng: Any, blocked: Any) -> Any:
+        """
+        Draw sidewinder runs: each run of a row (but the first) opens
+        NORTH from one random cell, the other cells of the run point
+        towards it. Runs never include a reserved cell.
+        """
+        height, width = self.height, self.width
+        parents = np.empty((height, width), dtype=np.uint8)
+        parents[0, :] = Wall.WEST
+        parents[0, 0] = 0
+        if height == 1:
+            return parents
+        close = rng.random((height, width)) < 0.5
+        close[:, -1] = True
+        close |= blocked
+        close[:, :-1] |= blocked[:, 1:]
+        flat_close = close[1:].ravel()
+        ends = np.flatnonzero(flat_close)
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        chosen = starts + (rng.random(len(ends)) *
+                           (ends - starts + 1)).astype(np.int64)
+        run = np.cumsum(flat_close) - flat_close
+        position = np.arange(flat_close.size)
+        target = chosen[run]
+        parents[1:] = np.where(
+            position == target, np.uint8(Wall.NORTH),
+            np.where(position < target, np.uint8(Wall.EAST),
+                     np.uint8(Wall.WEST))).reshape(height - 1, width)
+        return parents
+
+    def attach_orphans(self, rng: Any, parents: Any, blocked: Any) -> None:
+        """
+        Make every free cell reach the root, when the '42' cells allow.
+
+        Reserved cells lose their parent, and so do cells pointing into
+        one. Then, until nothing changes, every free cell that does not
+        reach the root takes as parent a neighbour that does. Such a
+        neighbour is never one of its descendants, so no cycle appears.
+        After the first pass, only the flat indices of those lost cells
+        are processed.
+        """
+        height, width = self.height, self.width
+        parents[blocked] = 0
+        parents[1:, :][(parents[1:, :] == Wall.NORTH) & blocked[:-1, :]] = 0
+        parents[:, :-1][(parents[:, :-1] == Wall.EAST) & blocked[:, 1:]] = 0
+        parents[:, 1:][(parents[:, 1:] == Wall.WEST) & blocked[:, :-1]] = 0
+        root = self.root(blocked)
+        parents.flat[root] = 0
+        flat = parents.ravel()
+        free = ~blocked.ravel()
+        reach = free & ~self.cut_off(parents, root).ravel()
+        lost = np.flatnonzero(free & ~reach)
+        while lost.size:
+            row, col = np.divmod(lost, width)
+            moves = ((Wall.NORTH, -width, row > 0),
+                     (Wall.EAST, 1, col + 1 < width),
+                     (Wall.SOUTH, width, row + 1 < height),
+                     (Wall.WEST, -1, col > 0))
+            attached = np.zeros(lost.size, dtype=bool)
+            for position in rng.permutation(len(moves)):
+                wall, step, inside = moves[position]
+                found = ~attached & inside &\
+                    reach[np.where(inside, lost + step, lost)]
+                flat[lost[found]] = wall
+                attached |= found
+            if not attached.any():
+                return
+            self.resolve(flat, lost, reach)
+            lost = lost[~reach[lost]]
+
+    def root(self, blocked: Any) -> int:
+        """
+        Return the flat index of the root: the top-left cell, or the
+        first free cell when it is reserved.
+        """
+        return int(np.argmin(blocked.ravel())) if blocked[0, 0] else 0
+
+    def cut_off(self, parents: Any, root: int) -> Any:
+        """
+        Return the mask of cells whose parent chain does not end at the
+        root, for parents pointing NORTH, EAST or WEST only.
+
+        Inside a row, EAST/WEST chains end at a head cell (pointing
+        NORTH or without parent) found with accumulated minima/maxima
+        over the whole grid. A cell is cut off when its head has no
+        parent (the root excepted), or points NORTH into a cut off
+        cell; only that last step runs row by row, from the first row
+        holding a cut and while cut off cells remain.
+        """
+        height, width = parents.shape
+        cols = np.arange(width)
+        west = parents == Wall.WEST
+        east = parents == Wall.EAST
+        left = np.maximum.accumulate(np.where(west, -1, cols), axis=1)
+        right = np.minimum.accumulate(
+            np.where(east, width, cols)[:, ::-1], axis=1)[:, ::-1]
+        head = np.where(west, left, np.where(east, right, cols))
+        head_parent = np.take_along_axis(parents, head, axis=1)
+        dead = head_parent == 0
+        root_row, root_col = divmod(root, width)
+        dead[root_row] &= head[root_row] != root_col
+        north = head_parent == Wall.NORTH
+        lost = np.zeros_like(dead)
+        dead_rows = np.flatnonzero(dead.any(axis=1))
+        if not dead_rows.size:
+            return lost
+        above = np.zeros(width, dtype=bool)
+        for row in range(int(dead_rows[0]), height):
+            current = dead[row] | (north[row] & above[head[row]])
+            lost[row] = current
+            if row >= dead_rows[-1] and not current.any():
+                break
+            above = current
+        return lost
+
+    def resolve(self, flat: Any, lost: Any, reach: Any) -> None:
+        """
+        Mark in `reach` the lost cells whose parent chain now ends at a
+        cell reaching the root.
+
+        Pointer jumping (each cell replaces its pointer by its
+        pointer's pointer) runs on the lost cells only: a chain leaving
+        them ends either on a reaching cell or on a dead end.
+
+        Args:
+            flat (Any): Flat parent direction of every cell.
+            lost (Any): Sorted flat indices of the lost cells.
+            reach (Any): Flat mask of the cells reaching the root,
+                updated in place.
+        """
+        count = lost.size
+        steps = np.zeros(16, dtype=np.int64)
+        steps[[Wall.NORTH, Wall.EAST, Wall.SOUTH, Wall.WEST]] =\
+            (-self.width, 1, self.width, -1)
+        target = lost + steps[flat[lost]]
+        has_parent = flat[lost] != 0
+        position = np.minimum(np.searchsorted(lost, target), count - 1)
+        # count: reaches the root, count + 1: dead end
+        pointer = np.full(count + 2, count + 1, dtype=np.int64)
+        pointer[count] = count
+        pointer[:count][has_parent & reach[target]] = count
+        inner = has_parent & (lost[position] == target)
+        pointer[:count][inner] = position[inner]
+        active = np.flatnonzero(pointer[:count] < count)
+        while active.size:
+            jumped = pointer[pointer[active]]
+            pointer[active] = jumped
+            active = active[jumped < count]
+        reach[lost[pointer[:count] == count]] = True
+
+    def walls_from_parents(self, parents: Any) -> Any:
+        """
+        Derive the 4-bit wall value of every cell: a cell opens the
+        wall towards its parent, and the parent the opposite wall.
+        """
+        cells = np.full(parents.shape, 15, dtype=np.uint8)
+        cells &= ~parents
+        cells[:-1, :] &= ~np.where(parents[1:, :] == Wall.NORTH,
+                                   np.uint8(Wall.SOUTH), np.uint8(0))
+        cells[:, 1:] &= ~np.where(parents[:, :-1] == Wall.EAST,
+                                  np.uint8(Wall.WEST), np.uint8(0))
+        cells[1:, :] &= ~np.where(parents[:-1, :] == Wall.SOUTH,
+                                  np.uint8(Wall.NORTH), np.uint8(0))
+        cells[:, :-1] &= ~np.where(parents[:, 1:] == Wall.WEST,
+                                   np.uint8(Wall.EAST), np.uint8(0))
+        return cells
+
+    def add_bulk_loops(self, rng: Any, cells: Any, blocked: Any) -> None:
+        """
+        Open random closed interior walls between free cells, each with
+        probability `loop_density`, creating cycles. The '42' cells are
+        never opened.
+        """
+        free = ~blocked
+        density = self.loop_density
+        east = (rng.random((self.height, self.width - 1)) < density) &\
+            free[:, :-1] & free[:, 1:] & (cells[:, :-1] & Wall.EAST != 0)
+        cells[:, :-1][east] &= ~np.uint8(Wall.EAST)
+        cells[:, 1:][east] &= ~np.uint8(Wall.WEST)
+        south = (rng.random((self.height - 1, self.width)) < density) &\
+            free[:-1, :] & free[1:, :] & (cells[:-1, :] & Wall.SOUTH != 0)
+        cells[:-1, :][south] &= ~np.uint8(Wall.SOUTH)
+        cells[1:, :][south] &= ~np.uint8(Wall.NORTH)
@@ -1,5 +1,10 @@
 from .config_parser import Configuration
 from .grid import Grid
+from typing import Dict, Iterable, List, Tuple
+
+# Maps a cell byte to its hexadecimal character (value modulo 16)
+_HEX_TABLE = bytes(ord("0123456789ABCDEF"[value % 16])
+                   for value in range(256))
 
 
 class OutputWriter():
@@ -32,7 +37,8 @@ class OutputWriter():
 
         The maze grid is encoded using hexadecimal characters
         (0-F), where each cell value is reduced modulo 16
-        to ensure a single hexadecimal digit per cell.
+        to ensure a single hexadecimal digit per cell. Each row
+        is converted in one pass over the grid row buffer.
 
         The final output structure is:
             1. Maze representation (HEIGHT x WIDTH characters).
@@ -51,13 +57,9 @@ class OutputWriter():
             None: Errors during file writing are caught and reported
             to standard output.
         """
-        report = ""
-        hex = "0123456789ABCDEF"
-        for row in range(self.config.height):
-            for col in range(self.config.width):
-                report += hex[grid.cells[row][col] % 16]
-            report += "\n"
-        report += "\n"
+        lines = [grid.get_row(row).translate(_HEX_TABLE).decode("ascii")
+                 for row in range(self.config.height)]
+        report = "\n".join(lines) + "\n\n"
 
         row, col = self.config.entry
         report += f"{row}, {col}\n"
@@ -73,3 +75,80 @@ class OutputWriter():
         except Exception:
             print(f"[ERROR] failed to write output file: "
                   f"{self.config.output_file}")
+
+    def create_streaming_output(self, rows: Iterable[bytes],
+                                path: str = "") -> None:
+        """
+        Write the maze report while its rows are being generated.
+
+        Each row is encoded and written as soon as it is produced
+        (e.g. by `EllerAlgorithm.iter_rows()`), so the full grid is
+        never held in memory. The file format is the one of
+        `create_output()`.
+
+        Args:
+            rows (Iterable[bytes]): Wall values of each row, top to
+                bottom, one byte per cell.
+            path (str): Shortest path to write after the coordinates.
+                It is usually unknown while streaming and defaults to
+                an empty line.
+
+        Raises:
+            None: Errors during file writing are caught and reported
+            to standard output.
+        """
+        try:
+            with open(self.config.output_file, "w") as f:
+                for cells in rows:
+                    f.write(cells.translate(_HEX_TABLE).decode("ascii"))
+                    f.write("\n")
+                row, col = self.config.entry
+                f.write(f"\n{row}, {col}\n")
+                row, col = self.config.exit
+                f.write(f"{row}, {col}\n{path}\n")
+        except Exception:
+            print(f"[ERROR] failed to write output file: "
+                  f"{self.config.output_file}")
+
+    def update_output(self, grid: Grid, changed: List[Tuple[int, int]],
+                      path: str) -> None:
+        """
+        Rewrite the changed cells of an output file in place.
+
+        Every maze line has the same length, so each changed row span
+        is overwritten at its offset without reading or rewriting the
+        other rows; the coordinates and path lines after the maze are
+        then written again. The file must have been created by
+        `create_output()` for a maze of the same size.
+
+        Args:
+            grid (Grid): Maze grid object containing cell values.
+            changed (List[Tuple[int, int]]): Coordinates of the cells
+                to rewrite (see `MazeGenerator.regenerate_region()`).
+            path (str): Current shortest path from entry to exit.
+
+        Raises:
+            None: Errors during file writing are caught and reported
+            to standard output.
+        """
+        width, height = self.config.width, self.config.height
+        spans: Dict[int, Tuple[int, int]] = {}
+        for row, col in changed:
+            left, right = spans.get(row, (col, col))
+            spans[row] = (min(left, col), max(right, col))
+        try:
+            with open(self.config.output_file, "r+b") as f:
+                for row, (left, right) in sorted(spans.items()):
+                    f.seek(row * (width + 1) + left)
+                    f.write(bytes(grid.get(row, col)
+                                  for col in range(left, right + 1)
+                                  ).translate(_HEX_TABLE))
+                f.seek(height * (width + 1))
+                row, col = self.config.entry
+                f.write(f"\n{row}, {col}\n".encode("ascii"))
+                row, col = self.config.exit
+                f.write(f"{row}, {col}\n{path}\n".encode("ascii"))
+                f.truncate()
+        except Exception:
+            print(f"[ERROR] failed to update output file: "
+                  f"{self.config.output_file}")
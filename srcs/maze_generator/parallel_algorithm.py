@@ -0,0 +1,260 @@
+from .abc_algorithm import DEFAULT_LOOP_DENSITY, Algorithm
+from .grid import Grid, Wall
+from .perfect_algorithm import PerfectAlgorithm
+from .rng import derive_rng, derive_seed, resolve_seed
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Set, Tuple
+from array import array
+
+# One carved tile: its cell bytes and the component of each free
+# cell on its edges (local flat index -> component number)
+TileResult = Tuple[bytes, Dict[int, int]]
+
+
+class _TileAlgorithm(PerfectAlgorithm):
+    """
+    DFS backtracker over a single tile, with the reserved cells that
+    fall inside it given by the caller.
+    """
+
+    def __init__(self, width: int, height: int,
+                 blocked: Set[Tuple[int, int]], seed: str) -> None:
+        super().__init__(width, height, (0, 0), (0, 0), True, seed)
+        self.blocked = blocked
+
+    def reserved_cells(self) -> Set[Tuple[int, int]]:
+        """
+        Return the reserved cells inside the tile.
+        """
+        return self.blocked
+
+    def carve_tile(self) -> TileResult:
+        """
+        Carve a spanning tree of every free area of the tile.
+
+        The reserved cells may split a tile into several areas; each
+        one is carved from its first cell in row-major order and gets
+        its own component number.
+
+        Returns:
+            TileResult: Cell bytes and edge cell components.
+        """
+        width, height = self.width, self.height
+        self.reset_rng()
+        self.visited = self.new_visited_map(self.blocked)
+        size = self.topology.size
+        edges = sorted(index for index in {
+            *range(width), *range(size - width, size),
+            *range(0, size, width), *range(width - 1, size, width)}
+            if not self.visited[index])
+        components: Dict[int, int] = {}
+        component = 0
+        start = self.visited.find(0)
+        while start != -1:
+            component += 1
+            self.carve_maze_from(self.topology.coords(start))
+            for index in edges:
+                if self.visited[index] and index not in components:
+                    components[index] = component
+            start = self.visited.find(0, start + 1)
+        cells = b"".join(self.grid.get_row(row) for row in range(height))
+        return cells, components
+
+
+def carve_tile(task: Tuple[int, int, Set[Tuple[int, int]], str]
+               ) -> TileResult:
+    """
+    Worker entry point: carve one tile.
+
+    Args:
+        task (Tuple[int, int, Set[Tuple[int, int]], str]): Tile width,
+            tile height, reserved cells in tile coordinates and the
+            tile seed.
+
+    Returns:
+        TileResult: Cell bytes and edge cell components.
+    """
+    width, height, blocked, seed = task
+    return _TileAlgorithm(width, height, blocked, seed).carve_tile()
+
+
+class ParallelAlgorithm(Algorithm):
+    """
+    Tiled maze generation spread over worker processes.
+
+    The grid is split into ``tile_size x tile_size`` tiles. Each tile
+    is carved independently by the DFS backtracker of
+    `PerfectAlgorithm` in a `ProcessPoolExecutor` worker, with a seed
+    derived from `seed` and the tile position (`rng.derive_seed`).
+    The tiles are then stitched: seam passages between neighbouring
+    tiles are shuffled with their own derived seed and opened, Kruskal
+    style, only when they join two components not connected yet.
+    Every tile gets a spanning tree and the seams a spanning tree of
+    the tiles, so the whole maze is perfect.
+
+    Results only depend on `seed` and `tile_size`: the number of
+    workers changes how fast tiles are carved, never which maze is
+    produced. With ``workers=1`` tiles are carved in-process.
+    """
+
+    def __init__(self, width: int, height: int,
+                 entry: Tuple[int, int], exit: Tuple[int, int],
+                 perfect: bool,
+                 seed: None | str,
+                 grid_factory: Callable[[int, int], Grid] = Grid,
+                 loop_density: float = DEFAULT_LOOP_DENSITY,
+                 workers: int | None = None,
+                 tile_size: int = 256) -> None:
+        """
+        Initialize the algorithm.
+
+        Args:
+            width (int): Maze width.
+            height (int): Maze height.
+            entry (Tuple[int, int]): Entry cell coordinates.
+            exit (Tuple[int, int]): Exit cell coordinates.
+            perfect (bool): Whether the maze must be perfect.
+            seed (None | str): Optional random seed for reproducibility.
+            grid_factory (Callable[[int, int], Grid]): Callable building
+                the grid from (width, height).
+            loop_density (float): Fraction of the closed interior
+                walls opened in non-perfect mazes.
+            workers (int | None): Number of worker processes, None for
+                one per CPU.
+            tile_size (int): Side of a square tile in cells.
+        """
+        if tile_size < 1:
+            raise ValueError("tile_size must be positive")
+        super().__init__(width, height, entry, exit, perfect, seed,
+                         grid_factory, loop_density)
+        self.workers = workers
+        self.tile_size = tile_size
+
+    def generate(self) -> Grid:
+        """
+        Generate the maze grid.
+
+        Steps:
+            1. Reserve special "42" cells if possible.
+            2. Carve every tile in the worker processes.
+            3. Copy the tiles into the grid, one band of rows at a time.
+            4. Open the seam passages joining the tiles.
+            5. Optionally remove additional walls if
+               non-perfect mode is enabled.
+
+        Returns:
+            Grid: The generated maze grid.
+        """
+        self.reset_rng()
+        base_seed = resolve_seed(self.seed, self.rng)
+        cells_42 = self.reserved_cells()
+        tiles = self.tile_bounds()
+        tasks = []
+        for row, col, top, left, bottom, right in tiles:
+            blocked = {(cell_row - top, cell_col - left)
+                       for cell_row, cell_col in cells_42
+                       if top <= cell_row < bottom and
+                       left <= cell_col < right}
+            tasks.append((right - left, bottom - top, blocked,
+                          derive_seed(base_seed, "tile", row, col)))
+        if self.workers == 1 or len(tasks) == 1:
+            results = [carve_tile(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(self.workers) as pool:
+                results = list(pool.map(carve_tile, tasks))
+
+        grid = self.grid
+        grid.reset_cells()
+        self.copy_tiles(tiles, results)
+        self.stitch(tiles, results, base_seed)
+        if not self.perfect:
+            self.rng.seed(derive_seed(base_seed, "loops"))
+            self.braid(cells_42)
+        return grid
+
+    def tile_bounds(self) -> List[Tuple[int, int, int, int, int, int]]:
+        """
+        Return every tile as (tile_row, tile_col, top, left, bottom,
+        right), bottom and right being exclusive, in row-major order.
+        """
+        size = self.tile_size
+        return [(top // size, left // size, top, left,
+                 min(top + size, self.height), min(left + size, self.width))
+                for top in range(0, self.height, size)
+                for left in range(0, self.width, size)]
+
+    def copy_tiles(self, tiles: List[Tuple[int, int, int, int, int, int]],
+                   results: List[TileResult]) -> None:
+        """
+        Store the carved tiles in the grid, one band of tile rows at a
+        time through `Grid.set_rows()`.
+        """
+        width = self.width
+        band = bytearray()
+        band_top = 0
+        for tile, (cells, _) in zip(tiles, results):
+            _, _, top, left, bottom, right = tile
+            if left == 0:
+                if band:
+                    self.grid.set_rows(band_top, band)
+                band = bytearray((bottom - top) * width)
+                band_top = top
+            tile_width = right - left
+            for line in range(bottom - top):
+                band[line * width + left:line * width + right] =\
+                    cells[line * tile_width:(line + 1) * tile_width]
+        if band:
+            self.grid.set_rows(band_top, band)
+
+    def stitch(self, tiles: List[Tuple[int, int, int, int, int, int]],
+               results: List[TileResult], base_seed: str) -> None:
+        """
+        Join the tile components through seam passages.
+
+        Every pair of neighbouring free cells on both sides of a tile
+        boundary is a candidate. Candidates are shuffled with a stream
+        derived from `base_seed` and opened when they join two
+        components that are not connected yet (union-find over
+        component numbers).
+        """
+        width = self.width
+        count = 0
+        owners: Dict[int, int] = {}
+        for tile, (_, components) in zip(tiles, results):
+            _, _, top, left, _, right = tile
+            tile_width = right - left
+            for local, component in components.items():
+                line, col = divmod(local, tile_width)
+                owners[(top + line) * width + left + col] =\
+                    count + component - 1
+            count += max(components.values(), default=0)
+
+        seams: List[Tuple[int, Wall]] = []
+        for _, _, top, left, bottom, right in tiles:
+            if right < width:
+                seams.extend(
+                    (row * width + right - 1, Wall.EAST)
+                    for row in range(top, bottom)
+                    if row * width + right - 1 in owners and
+                    row * width + right in owners)
+            if bottom < self.height:
+                seams.extend(
+                    ((bottom - 1) * width + col, Wall.SOUTH)
+                    for col in range(left, right)
+                    if (bottom - 1) * width + col in owners and
+                    bottom * width + col in owners)
+        derive_rng(base_seed, "seams").shuffle(seams)
+
+        parent = array("q", range(count))
+        for cell, wall in seams:
+            root_a = owners[cell]
+            while parent[root_a] != root_a:
+                parent[root_a] = parent[parent[root_a]]
+                root_a = parent[root_a]
+            root_b = owners[cell + (1 if wall == Wall.EAST else width)]
+            while parent[root_b] != root_b:
+                parent[root_b] = parent[parent[root_b]]
+                root_b = parent[root_b]
+            if root_a != root_b:
+                parent[root_b] = root_a
+                self.grid.open_passage_at(cell, wall)
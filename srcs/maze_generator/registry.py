@@ -0,0 +1,166 @@
+from .abc_algorithm import Algorithm
+from .eller_algorithm import EllerAlgorithm
+from .kruskal_algorithm import KruskalAlgorithm
+from .numpy_algorithm import HAS_NUMPY, NumpyAlgorithm
+from .parallel_algorithm import ParallelAlgorithm
+from .perfect_algorithm import PerfectAlgorithm
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+import json
+
+# Builds an Algorithm from
+# (width, height, entry, exit, perfect, seed, grid_factory)
+AlgorithmFactory = Callable[..., Algorithm]
+
+# Name accepted by `get_algorithm()` to pick an engine from the
+# calibration table
+AUTO = "auto"
+
+# Calibration table bundled with the package
+CALIBRATION_FILE = Path(__file__).with_name("calibration.json")
+
+_ALGORITHMS: Dict[str, AlgorithmFactory] = {}
+
+
+def register_algorithm(name: str, factory: AlgorithmFactory) -> None:
+    """
+    Make an Algorithm implementation selectable by name.
+
+    Args:
+        name (str): Name used by `ALGORITHM=` and `MazeGenerator`.
+        factory (AlgorithmFactory): Algorithm class, or any callable
+            taking (width, height, entry, exit, perfect, seed,
+            grid_factory) and returning an Algorithm.
+
+    Raises:
+        ValueError: If the name is empty, 'auto' or already taken.
+    """
+    if not name or name == AUTO:
+        raise ValueError(f"invalid algorithm name {name!r}")
+    if name in _ALGORITHMS:
+        raise ValueError(f"algorithm {name!r} is already registered")
+    _ALGORITHMS[name] = factory
+
+
+def algorithm_names() -> List[str]:
+    """
+    Return the registered algorithm names, in registration order.
+    """
+    return list(_ALGORITHMS)
+
+
+def get_algorithm(name: str) -> AlgorithmFactory:
+    """
+    Return the factory registered under a name.
+
+    Raises:
+        ValueError: If no algorithm has this name.
+    """
+    try:
+        return _ALGORITHMS[name]
+    except KeyError:
+        raise ValueError(f"unknown algorithm {name!r}, expected one of: "
+                         f"{', '.join([AUTO] + algorithm_names())}")
+
+
+def load_calibration(path: Path = CALIBRATION_FILE) -> Dict[str, Any]:
+    """
+    Read a calibration table written by `mazegen.benchmark`.
+
+    Returns:
+        Dict[str, Any]: The table, or an empty table when the file is
+        missing or unreadable.
+    """
+    try:
+        with open(path, "r") as f:
+            table: Dict[str, Any] = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return table
+
+
+def estimate_seconds(table: Dict[str, Any], name: str, cells: int,
+                     perfect: bool) -> float | None:
+    """
+    Estimate the generation time of an algorithm from a calibration
+    table, using the throughput measured at the closest size.
+
+    Returns:
+        float | None: Seconds, or None if the algorithm was not
+        measured for this `perfect` mode.
+    """
+    samples = table.get("results", {}).get(name, {}).get(
+        "perfect" if perfect else "imperfect")
+    if not samples:
+        return None
+    closest = min(samples, key=lambda sample: abs(sample["cells"] - cells))
+    return float(cells / closest["cells_per_second"])
+
+
+def select_algorithm(width: int, height: int, perfect: bool,
+                     table: Dict[str, Any] | None = None) -> str:
+    """
+    Pick an algorithm name for a maze size ('auto' mode).
+
+    Registered algorithms are tried in the table preference order
+    (DFS first); the first one expected to finish within the table
+    budget wins, which keeps the DFS look for interactive sizes. When
+    none fits, the fastest measured one is used.
+
+    Args:
+        width (int): Maze width.
+        height (int): Maze height.
+        perfect (bool): Whether the maze must be perfect.
+        table (Dict[str, Any] | None): Calibration table, the bundled
+            one by default.
+
+    Returns:
+        str: A registered algorithm name ("dfs" without calibration).
+    """
+    if table is None:
+        table = load_calibration()
+    cells = width * height
+    estimates = {name: estimate_seconds(table, name, cells, perfect)
+                 for name in algorithm_names()}
+    measured = {name: seconds for name, seconds in estimates.items()
+                if seconds is not None}
+    if not measured:
+        return "dfs"
+    budget = table.get("budget_seconds", 0.0)
+    preference: List[str] = table.get("preference", [])
+    for name in preference:
+        if name in measured and measured[name] <= budget:
+            return name
+    return min(measured, key=lambda name: measured[name])
+
+
+def create_algorithm(name: str, *args: Any, **kwargs: Any) -> Algorithm:
+    """
+    Instantiate an algorithm by name; 'auto' selects one from the
+    calibration table for the requested width/height/perfect.
+
+    Args:
+        name (str): Registered name or 'auto'.
+        *args (Any): (width, height, entry, exit, perfect, seed,
+            grid_factory) as for `Algorithm`.
+        **kwargs (Any): Extra keyword arguments of the factory.
+
+    Returns:
+        Algorithm: The algorithm instance.
+    """
+    if name == AUTO:
+        width, height, _, _, perfect = args[:5]
+        name = select_algorithm(width, height, perfect)
+    return get_algorithm(name)(*args, **kwargs)
+
+
+register_algorithm("dfs", PerfectAlgorithm)
+register_algorithm("kruskal", KruskalAlgorithm)
+register_algorithm("eller", EllerAlgorithm)
+register_algorithm("parallel", ParallelAlgorithm)
+if HAS_NUMPY:
+    register_algorithm("binary_tree",
+                       partial(NumpyAlgorithm, style="binary_tree"))
+    register_algorithm("sidewinder",
+                       partial(NumpyAlgorithm, style="sidewinder"))
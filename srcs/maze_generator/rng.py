@@ -0,0 +1,69 @@
+from random import Random
+from typing import Any
+
+# Separator between a seed and the labels of a derived stream
+SEED_SEPARATOR = "/"
+
+
+def new_rng(seed: None | str = None) -> Random:
+    """
+    Create an independent random stream.
+
+    Every Algorithm owns one such stream (``self.rng``) instead of
+    using the module-global functions of `random`, so generators
+    running in several threads, or interleaved in one thread, never
+    disturb each other.
+
+    Args:
+        seed (None | str): Seed of the stream; None (or an empty seed)
+            seeds it from fresh OS entropy.
+
+    Returns:
+        Random: The random stream.
+    """
+    return Random(seed or None)
+
+
+def resolve_seed(seed: None | str, rng: Random) -> str:
+    """
+    Return `seed`, or a new seed drawn from `rng` when none is given.
+
+    Used before deriving child streams, so that an unseeded run still
+    derives all its streams from a single value.
+
+    Args:
+        seed (None | str): Optional user seed.
+        rng (Random): Stream to draw a seed from.
+
+    Returns:
+        str: A non-empty seed.
+    """
+    return seed if seed else str(rng.getrandbits(64))
+
+
+def derive_seed(seed: str, *labels: Any) -> str:
+    """
+    Derive the seed of an independent child stream.
+
+    The child seed only depends on the parent seed and the labels
+    (e.g. ``derive_seed(seed, "tile", row, col)`` gives
+    ``"<seed>/tile/<row>/<col>"``), never on the order in which
+    children are created or on which thread / process uses them. Tiles,
+    batch items and workers get reproducible streams this way whatever
+    the concurrency.
+
+    Args:
+        seed (str): Parent seed.
+        *labels (Any): Labels identifying the child.
+
+    Returns:
+        str: The child seed.
+    """
+    return SEED_SEPARATOR.join([seed, *map(str, labels)])
+
+
+def derive_rng(seed: str, *labels: Any) -> Random:
+    """
+    Create the child stream of `derive_seed(seed, *labels)`.
+    """
+    return Random(derive_seed(seed, *labels))
@@ -1,6 +1,46 @@
-from .grid import Grid, Wall
+from .grid import Grid
+from .topology import Topology, OPEN_WALLS, DIRECTION_CHARS
 from collections import deque
-from typing import Tuple, List
+from collections.abc import Sequence
+from typing import Tuple, List, overload
+
+# Parent marker of the cell a search starts from (not a wall value)
+START = 0x10
+
+
+class CellReader(Sequence[int]):
+    """
+    Read-only flat view of the cell values of a grid.
+
+    ``reader[index]`` is ``grid.get_at(index)``: nothing is copied, so
+    compact storages (PackedGrid, MappedGrid, TiledGrid, EdgeGrid)
+    keep their memory footprint during a search, at the cost of one
+    method call per cell read.
+    """
+
+    def __init__(self, grid: Grid) -> None:
+        """
+        Args:
+            grid (Grid): Grid owning the data.
+        """
+        self._get_at = grid.get_at
+        self._size = grid.cells_count
+
+    @overload
+    def __getitem__(self, index: int) -> int:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[int]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        if isinstance(index, slice):
+            return [self._get_at(i) for i in range(self._size)[index]]
+        return self._get_at(index)
+
+    def __len__(self) -> int:
+        return self._size
 
 
 class Solver():
@@ -17,6 +57,9 @@ class Solver():
         - 'E' (East)
         - 'S' (South)
         - 'W' (West)
+
+    Cells are addressed by flat index (see `Topology`); open
+    directions come from the `OPEN_WALLS` lookup table.
     """
     def find_path(self, grid: Grid, entry: Tuple[int, int],
                   exit: Tuple[int, int]) -> str:
@@ -25,9 +68,16 @@ class Solver():
 
         This method:
             - Explores the maze level by level.
-            - Tracks visited cells to avoid revisiting.
-            - Accumulates movement directions while traversing.
+            - Reads the cell values once (`read_cells()`).
+            - Records, in a flat byte array, the wall each cell was
+              first entered through (0 meaning not visited yet), which
+              doubles as the visited map.
             - Stops as soon as the exit cell is reached.
+            - Rebuilds the direction string once, walking the recorded
+              walls back from the exit (`trace_path()`).
+
+        Queued cells only carry their flat index, so each step costs
+        O(1) whatever the path length.
 
         Args:
             grid (Grid): The maze grid containing wall information.
@@ -40,54 +90,122 @@ class Solver():
             Returns an empty string if no path exists.
         """
         self.grid = grid
-        start = entry
-        end = exit
-        queue = deque([(start, "")])
-        visited = set()
-        visited.add(start)
+        self.topology = Topology(grid.width, grid.height)
+        offset = self.topology.offset
+        border = self.topology.border
+        start = self.topology.index(*entry)
+        end = self.topology.index(*exit)
+        cells = self.read_cells(grid)
+        parents = bytearray(self.topology.size)
+        parents[start] = START
+        queue = deque([start])
         while queue:
-            current, cur_path = queue.popleft()
+            current = queue.popleft()
             if current == end:
-                return cur_path
-            neighbours = self.find_neighbours(current)
-            for neighbour, next_path in neighbours:
-                if neighbour not in visited:
-                    visited.add(neighbour)
-                    queue.append((neighbour, cur_path + next_path))
+                return self.trace_path(parents, offset, end)
+            for wall in OPEN_WALLS[cells[current] | border[current]]:
+                neighbour = current + offset[wall]
+                if not parents[neighbour]:
+                    parents[neighbour] = wall
+                    queue.append(neighbour)
         return ""
 
-    def find_neighbours(self,
-                        current_cell: Tuple[int, int]) -> List[
-                            Tuple[Tuple[int, int], str]]:
+    @staticmethod
+    def read_cells(grid: Grid) -> Sequence[int]:
+        """
+        Return the cell values of a grid indexed by flat index.
+
+        A plain `Grid` already stores one byte per cell: its buffer is
+        returned as is, so the search loops index a bytearray with no
+        copy. Other storages are read through a `CellReader`, which
+        calls `Grid.get_at()` per access instead of expanding the whole
+        grid to one byte per cell.
+        """
+        if type(grid) is Grid:
+            return grid.buffer
+        return CellReader(grid)
+
+    @staticmethod
+    def copy_cells(grid: Grid) -> bytes:
+        """
+        Return a copy of every cell value of a grid, one byte per
+        cell, read row by row in bulk.
+
+        This costs one byte per cell whatever the grid storage; it is
+        meant for consumers needing one contiguous buffer (NumPy).
+        """
+        return b"".join(grid.get_row(row) for row in range(grid.height))
+
+    @staticmethod
+    def trace_path(parents: bytearray, offset: Tuple[int, ...],
+                   end: int) -> str:
+        """
+        Rebuild the direction string leading to a cell.
+
+        Args:
+            parents (bytearray): Wall through which each cell was
+                entered, `START` for the first cell.
+            offset (Tuple[int, ...]): Index delta per wall value
+                (`Topology.offset`).
+            end (int): Flat index of the last cell of the path.
+
+        Returns:
+            str: Directions from the first cell to `end`.
+        """
+        directions = []
+        current = end
+        wall = parents[current]
+        while wall != START:
+            directions.append(DIRECTION_CHARS[wall])
+            current -= offset[wall]
+            wall = parents[current]
+        directions.reverse()
+        return "".join(directions)
+
+    def find_neighbours(self, current_cell: int) -> List[Tuple[int, str]]:
         """
         Return accessible neighbouring cells from the current cell.
 
         A neighbour is considered accessible if the corresponding
-        wall bit flag is not set (i.e., the wall is open).
+        wall bit flag is not set (i.e., the wall is open) and the
+        wall does not face the grid border.
 
         Each returned neighbour includes:
-            - The neighbour's coordinates.
+            - The neighbour's flat index.
             - The direction required to reach it.
 
         Args:
-            current_cell (Tuple[int, int]):
-                Current cell coordinates.
+            current_cell (int): Current cell flat index.
 
         Returns:
-            List[Tuple[Tuple[int, int], str]]:
+            List[Tuple[int, str]]:
                 List of reachable neighbours paired with their
                 movement direction.
         """
-        cur_row, cur_col = current_cell
-        neighbours = []
-        for wall in Wall:
-            if self.grid.cells[cur_row][cur_col] & wall.value == 0:
-                if wall is Wall.EAST:
-                    neighbours.append(((cur_row, cur_col + 1), "E"))
-                elif wall is Wall.WEST:
-                    neighbours.append(((cur_row, cur_col - 1), "W"))
-                elif wall is Wall.NORTH:
-                    neighbours.append(((cur_row - 1, cur_col), "N"))
-                elif wall is Wall.SOUTH:
-                    neighbours.append(((cur_row + 1, cur_col), "S"))
-        return neighbours
+        offset = self.topology.offset
+        walls = OPEN_WALLS[self.grid.get_at(current_cell) |
+                           self.topology.border[current_cell]]
+        return [(current_cell + offset[wall], DIRECTION_CHARS[wall])
+                for wall in walls]
+
+    @staticmethod
+    def path_cells(width: int, entry: Tuple[int, int],
+                   path: str) -> List[int]:
+        """
+        Return the flat indices of the cells a path goes through.
+
+        Args:
+            width (int): Maze width.
+            entry (Tuple[int, int]): Starting cell coordinates.
+            path (str): Directions ('N', 'E', 'S', 'W') from the entry.
+
+        Returns:
+            List[int]: The entry index followed by one index per step.
+        """
+        steps = {"N": -width, "E": 1, "S": width, "W": -1}
+        current = entry[0] * width + entry[1]
+        cells = [current]
+        for direction in path:
+            current += steps[direction]
+            cells.append(current)
+        return cells
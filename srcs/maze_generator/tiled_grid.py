@@ -0,0 +1,235 @@
+from .grid import Grid
+from typing import Iterator, List, Tuple
+
+
+class TiledGrid(Grid):
+    """
+    Grid split into fixed-size square tiles allocated on first write.
+
+    Cells live in ``tile_size x tile_size`` bytearrays (one byte per
+    cell). A tile that has never been written is not allocated and
+    reads as fully closed cells (15), so ``reset_cells()`` only drops
+    the tile table and untouched areas of a huge maze cost nothing.
+
+    Neighbouring cells mostly share a tile, which keeps the random
+    walk of the generator and the BFS of the solver inside a small
+    working set. Region operations (viewport rendering, partial
+    regeneration) can use ``tiles_in_region()`` / ``get_region()`` to
+    touch only the tiles they need.
+
+    Usage with MazeGenerator:
+        ``grid_factory=TiledGrid`` or
+        ``grid_factory=functools.partial(TiledGrid, tile_size=128)``
+    """
+    tiles: List[bytearray | None]
+
+    def __init__(self, width: int, height: int, tile_size: int = 64) -> None:
+        """
+        Initialize an empty tiled grid.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+            tile_size (int): Side of a square tile in cells.
+        """
+        if tile_size < 1:
+            raise ValueError("tile_size must be positive")
+        self.tile_size = tile_size
+        self.tile_cols = -(-width // tile_size)
+        self.tile_rows = -(-height // tile_size)
+        super().__init__(width, height)
+
+    def _allocate(self) -> bytearray:
+        """
+        Create an empty tile table; tiles are allocated lazily.
+        """
+        self.tiles = [None] * (self.tile_rows * self.tile_cols)
+        return bytearray()
+
+    def _tile_for_write(self, row: int, col: int) -> bytearray:
+        """
+        Return the tile holding (row, col), allocating it if needed.
+        """
+        position = (row // self.tile_size) * self.tile_cols +\
+            col // self.tile_size
+        tile = self.tiles[position]
+        if tile is None:
+            tile = bytearray(self._FILL) * (self.tile_size * self.tile_size)
+            self.tiles[position] = tile
+        return tile
+
+    def get(self, row: int, col: int) -> int:
+        """
+        Return the wall value of the cell at (row, col).
+        """
+        size = self.tile_size
+        tile = self.tiles[(row // size) * self.tile_cols + col // size]
+        if tile is None:
+            return self._FILL[0]
+        return tile[(row % size) * size + col % size]
+
+    def set(self, row: int, col: int, value: int) -> None:
+        """
+        Store the wall value of the cell at (row, col).
+        """
+        size = self.tile_size
+        self._tile_for_write(row, col)[(row % size) * size + col % size] =\
+            value
+
+    def get_at(self, index: int) -> int:
+        """
+        Return the wall value of the cell at a flat index.
+        """
+        return self.get(*divmod(index, self.width))
+
+    def set_at(self, index: int, value: int) -> None:
+        """
+        Store the wall value of the cell at a flat index.
+        """
+        self.set(*divmod(index, self.width), value)
+
+    def clear_wall(self, row: int, col: int, wall: int) -> None:
+        """
+        Open the given wall of cell (row, col) inside its tile.
+        """
+        size = self.tile_size
+        self._tile_for_write(row, col)[(row % size) * size + col % size] &=\
+            ~wall
+
+    def clear_wall_at(self, index: int, wall: int) -> None:
+        """
+        Open the given wall of the cell at a flat index.
+        """
+        self.clear_wall(*divmod(index, self.width), wall)
+
+    def get_row(self, row: int) -> bytes:
+        """
+        Return the wall values of one row as ``bytes``
+        (one byte per cell), copying one tile slice at a time.
+        """
+        return self._get_span(row, 0, self.width)
+
+    def set_rows(self, row: int, values: bytes | bytearray) -> None:
+        """
+        Store the wall values of consecutive rows, one tile slice at
+        a time. A last partial row only updates its leading cells.
+        """
+        size, width = self.tile_size, self.width
+        for first in range(0, len(values), width):
+            start = (row % size) * size
+            # Cells of this row present in `values`
+            count = min(width, len(values) - first)
+            for left in range(0, count, size):
+                right = min(left + size, count)
+                self._tile_for_write(row, left)[start:start + right - left] =\
+                    values[first + left:first + right]
+            row += 1
+
+    def _get_span(self, row: int, left: int, right: int) -> bytes:
+        """
+        Return cells [left, right) of a row as ``bytes``.
+        """
+        size = self.tile_size
+        start = (row % size) * size
+        tile_base = (row // size) * self.tile_cols
+        parts: List[bytes | bytearray] = []
+        col = left
+        while col < right:
+            end = min((col // size + 1) * size, right)
+            tile = self.tiles[tile_base + col // size]
+            if tile is None:
+                parts.append(self._FILL * (end - col))
+            else:
+                parts.append(tile[start + col % size:start + (end - 1) %
+                                  size + 1])
+            col = end
+        return b"".join(parts)
+
+    def reset_cells(self) -> None:
+        """
+        Reset all grid cells to 15 by releasing every tile.
+        """
+        self.tiles = [None] * (self.tile_rows * self.tile_cols)
+
+    @property
+    def allocated_tiles(self) -> int:
+        """
+        Number of tiles currently backed by memory.
+        """
+        return sum(tile is not None for tile in self.tiles)
+
+    def tile_of(self, row: int, col: int) -> Tuple[int, int]:
+        """
+        Return the (tile_row, tile_col) holding cell (row, col).
+        """
+        return row // self.tile_size, col // self.tile_size
+
+    def tile_bounds(self, tile_row: int,
+                    tile_col: int) -> Tuple[int, int, int, int]:
+        """
+        Return the cell bounds of a tile as (top, left, bottom, right),
+        bottom and right being exclusive.
+        """
+        top = tile_row * self.tile_size
+        left = tile_col * self.tile_size
+        return (top, left, min(top + self.tile_size, self.height),
+                min(left + self.tile_size, self.width))
+
+    def iter_tiles(self,
+                   allocated_only: bool = False) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over (tile_row, tile_col) pairs in row-major order.
+
+        Args:
+            allocated_only (bool): Skip tiles that were never written.
+        """
+        for tile_row in range(self.tile_rows):
+            for tile_col in range(self.tile_cols):
+                if allocated_only and self.tiles[
+                        tile_row * self.tile_cols + tile_col] is None:
+                    continue
+                yield tile_row, tile_col
+
+    def iter_tile_cells(
+            self, tile_row: int,
+            tile_col: int) -> Iterator[Tuple[int, int, int]]:
+        """
+        Iterate over the cells of one tile as (row, col, value).
+        """
+        top, left, bottom, right = self.tile_bounds(tile_row, tile_col)
+        for row in range(top, bottom):
+            for offset, value in enumerate(self._get_span(row, left, right)):
+                yield row, left + offset, value
+
+    def tiles_in_region(self, top_left: Tuple[int, int],
+                        bottom_right: Tuple[int, int]) -> List[
+                            Tuple[int, int]]:
+        """
+        Return the tiles overlapping an inclusive cell rectangle.
+
+        Args:
+            top_left (Tuple[int, int]): (row, col) of the first cell.
+            bottom_right (Tuple[int, int]): (row, col) of the last cell.
+        """
+        first_row, first_col = self.tile_of(*top_left)
+        last_row, last_col = self.tile_of(*bottom_right)
+        return [(tile_row, tile_col)
+                for tile_row in range(first_row, last_row + 1)
+                for tile_col in range(first_col, last_col + 1)]
+
+    def get_region(self, top_left: Tuple[int, int],
+                   bottom_right: Tuple[int, int]) -> List[bytes]:
+        """
+        Return the rows of an inclusive cell rectangle, reading only
+        the tiles it overlaps.
+
+        Args:
+            top_left (Tuple[int, int]): (row, col) of the first cell.
+            bottom_right (Tuple[int, int]): (row, col) of the last cell.
+
+        Returns:
+            List[bytes]: One ``bytes`` object per row of the region.
+        """
+        (top, left), (bottom, right) = top_left, bottom_right
+        return [self._get_span(row, left, right + 1)
+                for row in range(top, bottom + 1)]
@@ -0,0 +1,132 @@
+from enum import IntEnum
+from typing import Tuple
+
+
+class Wall(IntEnum):
+    """
+    Represents the four walls of a grid cell.
+
+    Each wall is encoded as a power of two so it can be used
+    as a bit flag inside a single integer (0-15).
+
+    Bit representation:
+        NORTH = 0001
+        EAST  = 0010
+        SOUTH = 0100
+        WEST  = 1000
+
+    This design allows efficient wall manipulation using
+    bitwise operations (&, |, ~).
+    """
+    NORTH = 1
+    EAST = 2
+    SOUTH = 4
+    WEST = 8
+
+    def opposite(self) -> "Wall":
+        """
+        Return the opposite wall.
+
+        Useful when removing a wall between two adjacent cells.
+        Example:
+            If you open the EAST wall of the current cell,
+            you must also open the WEST wall of the neighboring cell.
+        """
+        return {
+            Wall.NORTH: Wall.SOUTH,
+            Wall.SOUTH: Wall.NORTH,
+            Wall.EAST: Wall.WEST,
+            Wall.WEST: Wall.EAST}[self]
+
+
+# Directions in wall-bit order
+DIRECTIONS: Tuple[Wall, ...] = (Wall.NORTH, Wall.EAST, Wall.SOUTH, Wall.WEST)
+
+# OPEN_WALLS[mask]: walls whose bit is 0 (open) in a 4-bit mask
+OPEN_WALLS: Tuple[Tuple[Wall, ...], ...] = tuple(
+    tuple(wall for wall in DIRECTIONS if not mask & wall)
+    for mask in range(16))
+
+# CLOSED_WALLS[mask]: walls whose bit is 1 (closed) in a 4-bit mask
+CLOSED_WALLS: Tuple[Tuple[Wall, ...], ...] = tuple(
+    tuple(wall for wall in DIRECTIONS if mask & wall)
+    for mask in range(16))
+
+# OPPOSITE[wall]: wall on the other side, indexed by wall value
+OPPOSITE: Tuple[int, ...] = (0, Wall.SOUTH, Wall.WEST, 0, Wall.NORTH,
+                             0, 0, 0, Wall.EAST)
+
+# DIRECTION_CHARS[wall]: letter used in solution paths
+DIRECTION_CHARS: Tuple[str, ...] = ("", "N", "E", "", "S", "", "", "", "W")
+
+
+def wall_offsets(width: int) -> Tuple[int, ...]:
+    """
+    Return the flat index delta of the neighbour behind each wall value,
+    for rows of `width` cells.
+    """
+    return (0, -width, 1, 0, width, 0, 0, 0, -1)
+
+
+class Topology:
+    """
+    Flat integer addressing for a width x height grid.
+
+    Cell (row, col) is addressed by the single index
+    ``row * width + col`` (the same layout as ``Grid.buffer``).
+    Moving through a wall is ``index + offset[wall]`` and
+    ``border[index]`` holds the walls of a cell that face outside the
+    grid, so neighbour probing needs neither tuples nor bounds checks:
+
+        OPEN_WALLS[grid.get_at(index) | border[index]]
+
+    lists the directions that can be walked from a cell.
+
+    Attributes:
+        width (int): Number of columns.
+        height (int): Number of rows.
+        size (int): Number of cells.
+        offset (Tuple[int, ...]): Index delta per wall value.
+        border (bytearray): Per-cell mask of walls on the grid border.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Precompute the direction deltas and the border masks.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+        """
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.offset = wall_offsets(width)
+        row = bytearray(width)
+        row[0] |= Wall.WEST
+        row[-1] |= Wall.EAST
+        border = row * height
+        border[:width] = border[:width].translate(
+            bytes(value | Wall.NORTH for value in range(256)))
+        border[-width:] = border[-width:].translate(
+            bytes(value | Wall.SOUTH for value in range(256)))
+        self.border = border
+
+    def index(self, row: int, col: int) -> int:
+        """
+        Return the flat index of cell (row, col).
+        """
+        return row * self.width + col
+
+    def coords(self, index: int) -> Tuple[int, int]:
+        """
+        Return the (row, col) coordinates of a flat index.
+        """
+        return divmod(index, self.width)
+
+    def neighbour(self, index: int, wall: int) -> int:
+        """
+        Return the index of the cell behind a wall. The wall must not
+        face the grid border.
+        """
+        return index + self.offset[wall]
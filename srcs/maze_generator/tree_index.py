@@ -0,0 +1,158 @@
+from .distance_index import DistanceIndex
+from .grid import Grid
+from .topology import OPPOSITE, DIRECTION_CHARS
+from array import array
+from typing import Tuple
+
+
+class TreeIndex:
+    """
+    Path queries between any two cells of a perfect maze.
+
+    A perfect maze is a spanning tree: the BFS of a `DistanceIndex`,
+    rooted at the entry, gives every cell its depth and its parent
+    wall. The path between two cells climbs from both to their lowest
+    common ancestor (LCA).
+
+    To find the LCA quickly, every cell also stores one jump pointer
+    to an ancestor higher up (skew-binary jump pointers, a form of
+    binary lifting that keeps a single flat array instead of one per
+    power of two). The jump of a cell is its parent's jump's jump when
+    the two jumps above the parent have the same length, otherwise its
+    parent. Any ancestor, hence the LCA, is reached in O(log n) jumps.
+
+    After one O(n) preprocessing:
+        - `distance(a, b)` costs O(log n);
+        - `path(a, b)` costs O(log n) plus the path length.
+
+    The index is only meaningful for perfect mazes: with loops the BFS
+    tree is just one of the spanning trees and its paths are not the
+    shortest ones.
+
+    Attributes:
+        topology (Topology): Flat cell indexing of the grid.
+        depths (array): Steps from the entry per cell, -1 when the
+            cell can not be reached.
+        parents (bytearray): Wall each cell was entered through from
+            its parent, `START` for the entry, 0 when unreachable.
+        jumps (array): Flat index of the jump target of each cell, the
+            entry pointing to itself.
+    """
+
+    def __init__(self, grid: Grid, entry: Tuple[int, int]) -> None:
+        """
+        Root the maze tree at the entry and compute the jump pointers.
+
+        Args:
+            grid (Grid): The perfect maze grid.
+            entry (Tuple[int, int]): Root cell coordinates.
+        """
+        tree = DistanceIndex(grid, entry)
+        self.topology = tree.topology
+        self.depths = depths = tree.distances
+        self.parents = parents = tree.parents
+        offset = self.topology.offset
+        root = tree.order[0]
+        self.jumps = jumps = array(depths.typecode, [0]) * len(depths)
+        jumps[root] = root
+        # BFS order visits a parent before its children
+        for cell in tree.order[1:]:
+            parent = cell - offset[parents[cell]]
+            jump = jumps[parent]
+            if (depths[parent] - depths[jump]
+                    == depths[jump] - depths[jumps[jump]]):
+                jumps[cell] = jumps[jump]
+            else:
+                jumps[cell] = parent
+
+    def ancestor(self, cell: int, depth: int) -> int:
+        """
+        Return the ancestor of a cell at a given depth.
+
+        Args:
+            cell (int): Flat index of the cell.
+            depth (int): Depth of the ancestor, at most the cell depth.
+
+        Returns:
+            int: Flat index of the ancestor.
+        """
+        offset = self.topology.offset
+        depths, parents, jumps = self.depths, self.parents, self.jumps
+        while depths[cell] > depth:
+            if depths[jumps[cell]] >= depth:
+                cell = jumps[cell]
+            else:
+                cell -= offset[parents[cell]]
+        return cell
+
+    def common_ancestor(self, first: int, second: int) -> int:
+        """
+        Return the lowest common ancestor of two reachable cells.
+
+        Args:
+            first (int): Flat index of a cell.
+            second (int): Flat index of another cell.
+
+        Returns:
+            int: Flat index of the deepest cell on both root paths.
+        """
+        offset = self.topology.offset
+        depths, parents, jumps = self.depths, self.parents, self.jumps
+        if depths[first] > depths[second]:
+            first = self.ancestor(first, depths[second])
+        else:
+            second = self.ancestor(second, depths[first])
+        # Jumps only depend on depth, so both sides stay level
+        while first != second:
+            if jumps[first] != jumps[second]:
+                first, second = jumps[first], jumps[second]
+            else:
+                first -= offset[parents[first]]
+                second -= offset[parents[second]]
+        return first
+
+    def distance(self, a: Tuple[int, int], b: Tuple[int, int]) -> int:
+        """
+        Return the number of steps between two cells, or -1 if one of
+        them can not be reached.
+        """
+        first = self.topology.index(*a)
+        second = self.topology.index(*b)
+        if not self.parents[first] or not self.parents[second]:
+            return -1
+        lowest = self.common_ancestor(first, second)
+        return (self.depths[first] + self.depths[second]
+                - 2 * self.depths[lowest])
+
+    def path(self, a: Tuple[int, int], b: Tuple[int, int]) -> str:
+        """
+        Return the path from one cell to another.
+
+        Args:
+            a (Tuple[int, int]): Starting cell coordinates.
+            b (Tuple[int, int]): Target cell coordinates.
+
+        Returns:
+            str: Directions ('N', 'E', 'S', 'W') from `a` to `b`; an
+            empty string if one of them can not be reached.
+        """
+        first = self.topology.index(*a)
+        second = self.topology.index(*b)
+        parents = self.parents
+        if not parents[first] or not parents[second]:
+            return ""
+        offset = self.topology.offset
+        lowest = self.common_ancestor(first, second)
+        # Up from `a`: each step goes against the wall it was entered by
+        up = []
+        while first != lowest:
+            wall = parents[first]
+            up.append(DIRECTION_CHARS[OPPOSITE[wall]])
+            first -= offset[wall]
+        down = []
+        while second != lowest:
+            wall = parents[second]
+            down.append(DIRECTION_CHARS[wall])
+            second -= offset[wall]
+        down.reverse()
+        return "".join(up) + "".join(down)
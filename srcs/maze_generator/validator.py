@@ -0,0 +1,304 @@
+from .grid import Grid, Wall
+from dataclasses import dataclass, field
+from itertools import accumulate
+from pathlib import Path
+from typing import List, Set, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_NUMPY = False
+
+# Per-value tables: 1 if the given wall is closed, else 0
+_CLOSED = {wall: bytes(value >> (wall.bit_length() - 1) & 1
+                       for value in range(256)) for wall in Wall}
+# Per-value tables: 1 if the given wall is open, else 0
+_OPEN = {wall: bytes(1 - (value >> (wall.bit_length() - 1) & 1)
+                     for value in range(256)) for wall in Wall}
+# 1 for a cell with its four walls closed
+_FULLY_CLOSED = bytes(value & 15 == 15 for value in range(256))
+# Hexadecimal character of the output file -> cell value (0xFF if invalid)
+_HEX_VALUE = bytes(int(chr(char), 16) if chr(char) in
+                   "0123456789abcdefABCDEF" else 0xFF
+                   for char in range(256))
+
+
+@dataclass
+class ValidationReport:
+    """
+    Result of a whole-maze validation.
+
+    Attributes:
+        asymmetric_walls (int): Shared walls seen as open on one side
+            and closed on the other.
+        open_borders (int): Outer border walls that are open.
+        unreachable_cells (int): Non-reserved cells not reachable from
+            the entry.
+        passages (int): Number of open interior walls.
+        open_cells (int): Number of non-reserved cells.
+        is_tree (bool): True when the open cells form a spanning tree
+            (connected and passages == open_cells - 1).
+        errors (List[str]): Human readable description of each problem.
+    """
+    asymmetric_walls: int = 0
+    open_borders: int = 0
+    unreachable_cells: int = 0
+    passages: int = 0
+    open_cells: int = 0
+    is_tree: bool = False
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        True if no error was found.
+        """
+        return not self.errors
+
+
+def validate_grid(grid: Grid, entry: Tuple[int, int],
+                  perfect: bool = False,
+                  blocked: Set[Tuple[int, int]] | None = None
+                  ) -> ValidationReport:
+    """
+    Check a whole maze grid.
+
+    Verified properties:
+        - Neighbouring cells agree on every shared wall.
+        - Every outer border wall is closed.
+        - Every non-reserved cell is reachable from `entry`.
+        - When `perfect` is True, the passages form a tree
+          (passages == cells - 1).
+
+    Wall agreement, border and passage counts are computed a whole row
+    at a time with byte translation tables. Reachability labels the
+    connected areas of the grid (see `reached_cells()`), row-wise
+    rather than with a per-cell walk.
+
+    Args:
+        grid (Grid): Grid to check (any Grid backend).
+        entry (Tuple[int, int]): Entry cell coordinates (row, col).
+        perfect (bool): Whether the maze must be perfect.
+        blocked (Set[Tuple[int, int]] | None): Reserved '42' cells,
+            e.g. from `Algorithm.get_42_cells()`. When None, fully
+            closed cells are treated as reserved (how the '42' pattern
+            appears in output files).
+
+    Returns:
+        ValidationReport: Counters and error messages.
+    """
+    report = ValidationReport()
+    width, height = grid.width, grid.height
+    rows = [grid.get_row(row) for row in range(height)]
+
+    for row, cells in enumerate(rows):
+        east = int.from_bytes(cells[:-1].translate(_CLOSED[Wall.EAST]), "big")
+        west = int.from_bytes(cells[1:].translate(_CLOSED[Wall.WEST]), "big")
+        report.asymmetric_walls += (east ^ west).bit_count()
+        report.passages += cells[:-1].translate(
+            _CLOSED[Wall.EAST]).count(0)
+        if row + 1 < height:
+            south = int.from_bytes(cells.translate(_CLOSED[Wall.SOUTH]),
+                                   "big")
+            north = int.from_bytes(rows[row + 1].translate(
+                _CLOSED[Wall.NORTH]), "big")
+            report.asymmetric_walls += (south ^ north).bit_count()
+            report.passages += cells.translate(
+                _CLOSED[Wall.SOUTH]).count(0)
+        report.open_borders += (cells[0] & Wall.WEST == 0) +\
+            (cells[-1] & Wall.EAST == 0)
+    report.open_borders += rows[0].translate(
+        _CLOSED[Wall.NORTH]).count(0)
+    report.open_borders += rows[-1].translate(
+        _CLOSED[Wall.SOUTH]).count(0)
+
+    flat = bytearray(b"".join(rows))
+    reserved = bytearray(grid.cells_count)
+    if blocked is None:
+        if grid.cells_count > 1:
+            reserved = flat.translate(_FULLY_CLOSED)
+    else:
+        for row, col in blocked:
+            reserved[row * width + col] = 1
+    reserved_count = reserved.count(1)
+    report.open_cells = grid.cells_count - reserved_count
+
+    visited = reached_cells(flat, width, height,
+                            entry[0] * width + entry[1])
+    reached = int.from_bytes(visited, "big")
+    reached_reserved = (reached & int.from_bytes(reserved, "big")).bit_count()
+    report.unreachable_cells = report.open_cells -\
+        (reached.bit_count() - reached_reserved)
+    report.is_tree = report.unreachable_cells == 0 and\
+        report.passages == report.open_cells - 1
+
+    if report.asymmetric_walls:
+        report.errors.append(f"{report.asymmetric_walls} shared walls "
+                             "differ between neighbouring cells")
+    if report.open_borders:
+        report.errors.append(f"{report.open_borders} border walls are open")
+    if report.unreachable_cells:
+        report.errors.append(f"{report.unreachable_cells} cells are not "
+                             "reachable from the entry")
+    if perfect and not report.is_tree:
+        report.errors.append(
+            f"maze is not perfect: {report.passages} passages for "
+            f"{report.open_cells} cells")
+    return report
+
+
+def reached_cells(cells: bytes | bytearray, width: int, height: int,
+                  start: int) -> bytes:
+    """
+    Return, one byte per cell, 1 for the cells connected to `start`.
+
+    Passages are read from the east and south walls of each cell (a
+    wall the two sides disagree on is reported by `validate_grid()`).
+    With NumPy, connected areas are labelled by `_label_numpy()`;
+    otherwise by `_label_runs()`.
+
+    Args:
+        cells (bytes | bytearray): Cell values, rows concatenated.
+        width (int): Number of columns.
+        height (int): Number of rows.
+        start (int): Flat index of the starting cell.
+
+    Returns:
+        bytes: 1 for each cell connected to `start`, else 0.
+    """
+    if HAS_NUMPY:
+        return _label_numpy(cells, width, height, start)
+    return _label_runs(cells, width, height, start)
+
+
+def _label_numpy(cells: bytes | bytearray, width: int, height: int,
+                 start: int) -> bytes:
+    """
+    Label connected cells with array operations.
+
+    Every cell starts with its own index as label. Each round, the
+    label of every passage end with the larger label is pointed at
+    the smaller one, then labels are followed to their root (pointer
+    jumping). Only the passages still joining two labels are kept for
+    the next round. Each round costs a few array operations over the
+    passages and no Python code runs per cell; generated mazes need
+    about ten rounds.
+    """
+    values = np.frombuffer(bytes(cells), dtype=np.uint8).reshape(height,
+                                                                 width)
+    index = np.arange(width * height).reshape(height, width)
+    east = index[:, :-1][(values[:, :-1] & Wall.EAST) == 0]
+    south = index[:-1, :][(values[:-1, :] & Wall.SOUTH) == 0]
+    first = np.concatenate([east, south])
+    second = np.concatenate([east + 1, south + width])
+    labels = np.arange(width * height)
+    while first.size:
+        first_label, second_label = labels[first], labels[second]
+        apart = first_label != second_label
+        first, second = first[apart], second[apart]
+        first_label, second_label = first_label[apart], second_label[apart]
+        labels[np.maximum(first_label, second_label)] = np.minimum(
+            first_label, second_label)
+        while True:
+            roots = labels[labels]
+            if np.array_equal(roots, labels):
+                break
+            labels = roots
+    connected: bytes = (labels == labels[start]).astype(np.uint8).tobytes()
+    return connected
+
+
+def _label_runs(cells: bytes | bytearray, width: int, height: int,
+                start: int) -> bytes:
+    """
+    Label connected cells with a union-find over horizontal runs.
+
+    Cells joined by open east walls form a run; run numbers are
+    assigned to every cell at once (a running count of the run ends).
+    The runs are then merged through the open south walls, found with
+    `bytes.find()`, in a union-find. The Python loop therefore runs
+    once per vertical passage and once per run, not per cell; both are
+    proportional to the number of cells (about half of it in a perfect
+    maze).
+    """
+    ends = bytearray(cells.translate(_CLOSED[Wall.EAST]))
+    ends[width - 1::width] = b"\x01" * height
+    runs = list(accumulate(ends, initial=0))
+    parents = list(range(runs[-1]))
+
+    def find(run: int) -> int:
+        root = run
+        while parents[root] != root:
+            root = parents[root]
+        while parents[run] != root:
+            parents[run], run = root, parents[run]
+        return root
+
+    south = cells[:-width].translate(_OPEN[Wall.SOUTH])
+    index = south.find(1)
+    while index != -1:
+        upper, lower = find(runs[index]), find(runs[index + width])
+        if upper != lower:
+            parents[upper] = lower
+        index = south.find(1, index + 1)
+    root = find(runs[start])
+    connected = bytes(find(run) == root for run in range(len(parents)))
+    return bytes(map(connected.__getitem__, runs[:-1]))
+
+
+def read_maze_file(
+        file_path: str | Path) -> Tuple[Grid, Tuple[int, int],
+                                        Tuple[int, int], str]:
+    """
+    Load a maze written by `OutputWriter.create_output`.
+
+    Args:
+        file_path (str | Path): Output file to read.
+
+    Returns:
+        Tuple[Grid, Tuple[int, int], Tuple[int, int], str]:
+            The grid, entry, exit and solution path.
+
+    Raises:
+        ValueError: If the file does not follow the output format.
+    """
+    with open(file_path, "r") as f:
+        lines = f.read().split("\n")
+    try:
+        height = lines.index("")
+    except ValueError:
+        raise ValueError(f"{file_path}: missing empty line after the maze")
+    if height == 0 or len(lines) < height + 4:
+        raise ValueError(f"{file_path}: incomplete maze file")
+    width = len(lines[0])
+    grid = Grid(width, height)
+    for row in range(height):
+        values = lines[row].encode().translate(_HEX_VALUE)
+        if len(values) != width or 0xFF in values:
+            raise ValueError(f"{file_path}: invalid maze row {row}")
+        grid.buffer[row * width:(row + 1) * width] = values
+    try:
+        entry_row, entry_col = lines[height + 1].split(",")
+        exit_row, exit_col = lines[height + 2].split(",")
+        entry = (int(entry_row), int(entry_col))
+        exit = (int(exit_row), int(exit_col))
+    except ValueError:
+        raise ValueError(f"{file_path}: invalid entry/exit coordinates")
+    return grid, entry, exit, lines[height + 3]
+
+
+def validate_file(file_path: str | Path,
+                  perfect: bool = False) -> ValidationReport:
+    """
+    Validate a maze file written by `OutputWriter.create_output`.
+
+    Args:
+        file_path (str | Path): Output file to check.
+        perfect (bool): Whether the maze must be perfect.
+
+    Returns:
+        ValidationReport: Counters and error messages.
+    """
+    grid, entry, _, _ = read_maze_file(file_path)
+    return validate_grid(grid, entry, perfect)
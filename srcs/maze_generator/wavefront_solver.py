@@ -0,0 +1,123 @@
+from .grid import Grid
+from .solver import Solver
+from .topology import Topology, DIRECTIONS, OPPOSITE, DIRECTION_CHARS
+from typing import Any, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_NUMPY = False
+
+
+class WavefrontSolver(Solver):
+    """
+    Breadth-First Search expanding whole layers at once using NumPy.
+
+    The cells are copied into one contiguous buffer (`copy_cells()`)
+    and their open sides decoded once into four boolean arrays (one
+    per wall, border walls counting as closed). A BFS
+    layer is then expanded with a handful of array operations: the
+    frontier cells whose side is open are moved through it by the
+    flat index offset of that side, cells already reached are masked
+    out and the rest get the step number in a distance array and form
+    the next frontier. The search stops when the exit gets a distance;
+    no Python code runs per cell.
+
+    The frontier is kept as the array of its flat indices rather than
+    a boolean array of the whole grid, so a layer costs the size of
+    the frontier instead of the number of cells, and the whole search
+    stays O(n) however long the path is.
+
+    The path is then walked back from the exit, each step moving to
+    an open neighbour one layer closer to the entry, and returned in
+    the same 'NESW' format as `Solver`. It has the length of
+    `Solver.find_path()`, but may be another shortest path.
+
+    NumPy is an optional dependency (``pip install mazegen[numpy]``);
+    creating the solver without it raises ImportError.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the solver.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if not HAS_NUMPY:
+            raise ImportError("WavefrontSolver requires NumPy "
+                              "(pip install mazegen[numpy])")
+
+    def find_path(self, grid: Grid, entry: Tuple[int, int],
+                  exit: Tuple[int, int]) -> str:
+        """
+        Compute a shortest path from entry to exit, one BFS layer at a
+        time.
+
+        Args:
+            grid (Grid): The maze grid containing wall information.
+            entry (Tuple[int, int]): Starting cell coordinates.
+            exit (Tuple[int, int]): Target cell coordinates.
+
+        Returns:
+            str: Shortest path as a sequence of directions
+            ('N', 'E', 'S', 'W').
+            Returns an empty string if no path exists.
+        """
+        self.grid = grid
+        self.topology = Topology(grid.width, grid.height)
+        offset = self.topology.offset
+        cells = (np.frombuffer(self.copy_cells(grid), dtype=np.uint8)
+                 | np.frombuffer(self.topology.border, dtype=np.uint8))
+        sides = [((cells & wall) == 0, offset[wall]) for wall in DIRECTIONS]
+        distances = np.full(self.topology.size, -1, dtype=np.int64)
+        start = self.topology.index(*entry)
+        end = self.topology.index(*exit)
+        distances[start] = 0
+        frontier = np.array([start], dtype=np.int64)
+        step = 0
+        while distances[end] < 0:
+            step += 1
+            reached = np.concatenate([frontier[open_side[frontier]] + delta
+                                      for open_side, delta in sides])
+            reached = reached[distances[reached] < 0]
+            if not reached.size:
+                return ""
+            distances[reached] = step
+            # a cell reached from several sides is kept once
+            frontier = np.unique(reached)
+        return self.backtrack(cells, distances, offset, end)
+
+    @staticmethod
+    def backtrack(cells: Any, distances: Any, offset: Tuple[int, ...],
+                  end: int) -> str:
+        """
+        Walk from a cell back to the entry through the distance layers
+        and return the directions from the entry.
+
+        Args:
+            cells (Any): Cell values with the border walls closed, one
+                per flat index.
+            distances (Any): BFS layer of each cell, -1 if not reached.
+            offset (Tuple[int, ...]): Index delta per wall value
+                (`Topology.offset`).
+            end (int): Flat index of the last cell of the path.
+
+        Returns:
+            str: Directions ('N', 'E', 'S', 'W') from the entry.
+        """
+        current = end
+        step = int(distances[current])
+        directions = []
+        while step > 0:
+            value = int(cells[current])
+            for wall in DIRECTIONS:
+                if (not value & wall
+                        and distances[current + offset[wall]] == step - 1):
+                    break
+            directions.append(DIRECTION_CHARS[OPPOSITE[wall]])
+            current += offset[wall]
+            step -= 1
+        directions.reverse()
+        return "".join(directions)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List, Tuple, TYPE_CHECKING
+from typing import Sequence, Tuple, TYPE_CHECKING
 import random
 import sys
 from abc import ABC, abstractmethod
@@ -28,11 +28,11 @@ class MazeVisualizer(MyMLX, ABC):
         const (MazeParams): Configuration constants for colors and dimensions.
         generator (MazeGenerator): The engine responsible for maze structure.
         solver (Solver): The algorithm used to find the path through the maze.
-        cells (List[List[int]]): The current grid state of the maze.
+        cells (Sequence[Sequence[int]]): The current grid state of the maze.
         txt_to_image (TxtToImage): Pipeline for rendering styled UI text.
     """
     def __init__(self, name: str, w: int, h: int,
-                 const: MazeParams, cells: List[List[int]],
+                 const: MazeParams, cells: Sequence[Sequence[int]],
                  entry: Tuple[int, int], exit: Tuple[int, int],
                  path: str = "", generator: MazeGenerator = None,
                  output_writer: OutputWriter = None):
@@ -121,7 +121,7 @@ class MazeVisualizer(MyMLX, ABC):
             self.stop_mlx(self.mlx)
 
     @abstractmethod
-    def display_maze(self, maze: List[List[int]],
+    def display_maze(self, maze: Sequence[Sequence[int]],
                      color: int = 0xFFFFFFFF) -> None:
         """Abstract method to render the maze grid. Must be implemented
         by subclasses.
@@ -170,7 +170,7 @@ class MazeVisualizerOne(MazeVisualizer):
         0: North, 1: East, 2: South, 3: West
         Bit value 1 indicates a closed wall, 0 indicates an open passage.
     """
-    def display_maze(self, maze: List[List[int]],
+    def display_maze(self, maze: Sequence[Sequence[int]],
                      color: int = 0xFFFFFFFF) -> None:
         """Renders the maze structure by iterating through cell bitmasks.
 
@@ -179,7 +179,8 @@ class MazeVisualizerOne(MazeVisualizer):
         fill logic.
 
         Args:
-            maze: 2D list of integers representing the wall bitmasks.
+            maze: 2D sequence of integers representing the wall bitmasks
+                (e.g. ``Grid.cells``).
             color: Hexadecimal color for the walls.
         """
         maze_w, maze_h = len(maze[0]), len(maze)
@@ -189,9 +190,10 @@ class MazeVisualizerOne(MazeVisualizer):
         wall = self.const.wall_thickness
         bits = [0, 3, 1, 2]
         for y in range(maze_h):
+            row = list(maze[y])
             for bit in bits:
                 for x in range(maze_w):
-                    val = maze[y][x]
+                    val = row[x]
                     top_x, top_y, h, w = 0, 0, 0, 0
                     if bit == 0:
                         top_x = x * spacing + offset